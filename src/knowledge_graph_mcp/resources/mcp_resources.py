@@ -8,10 +8,84 @@ import logging
 
 from mcp.server.fastmcp import FastMCP
 
-from .schemas import knowledge_graph_schema
+from .schemas import PROPERTY_TYPES, knowledge_graph_schema
 
 logger = logging.getLogger("knowledge-graph-mcp.schema_resources")
 
+# The validation guide never changes, so it is serialized once at import
+_VALIDATION_GUIDE = {
+    "version": "1.0.0",
+    "title": "Knowledge Graph Validation Guide",
+    "sections": {
+        "entity_creation": {
+            "description": "Guidelines for creating entities in the knowledge graph",
+            "rules": [
+                "All required properties must be provided",
+                "Property values must match defined data types",
+                "Unique constraints must be respected",
+                "Use consistent naming conventions (snake_case for properties)",
+                "Provide meaningful descriptions for business entities",
+            ],
+        },
+        "relationship_creation": {
+            "description": "Guidelines for creating relationships between entities",
+            "rules": [
+                "Relationships must exist between valid entity type combinations",
+                "Use predefined relationship types from the schema",
+                "Ensure directional relationships are created correctly",
+                "Avoid creating duplicate relationships",
+                "Include relationship properties when relevant",
+            ],
+        },
+        "data_types": {
+            "supported_types": list(PROPERTY_TYPES),
+            "validation_rules": [
+                "String properties should have reasonable length limits",
+                "Enum properties must use predefined values",
+                "DateTime properties should use ISO 8601 format",
+                "Array properties should contain homogeneous data types",
+                "Sensitive properties should be marked and handled appropriately",
+            ],
+        },
+        "best_practices": {
+            "modeling": [
+                "Start with core business entities",
+                "Model relationships that provide business value",
+                "Use consistent entity and property naming",
+                "Document complex business rules and calculations",
+                "Regularly review and update the schema",
+            ],
+            "performance": [
+                "Create indexes on frequently queried properties",
+                "Use constraints to maintain data integrity",
+                "Avoid deeply nested relationship chains in queries",
+                "Consider relationship direction for query optimization",
+                "Monitor query performance and adjust indexes",
+            ],
+        },
+    },
+    "examples": {
+        "valid_entity": {
+            "type": "Service",
+            "properties": {
+                "name": "user-authentication-service",
+                "version": "2.1.0",
+                "description": "Handles user authentication and authorization",
+                "status": "active",
+                "created_at": "2024-01-15T10:30:00Z",
+                "updated_at": "2024-01-20T14:45:00Z",
+            },
+        },
+        "valid_relationship": {
+            "from_entity": {"type": "Service", "name": "user-service"},
+            "to_entity": {"type": "Database", "name": "user-db"},
+            "relationship_type": "OWNS",
+            "description": "User service owns and manages the user database",
+        },
+    },
+}
+_VALIDATION_GUIDE_JSON = json.dumps(_VALIDATION_GUIDE, indent=2)
+
 
 def register_schema_resources(mcp: FastMCP):
     """Register all schema resources with the MCP server."""
@@ -47,7 +121,7 @@ def register_schema_resources(mcp: FastMCP):
         """
         try:
             logger.info("Serving knowledge graph schema summary")
-            return json.dumps(knowledge_graph_schema.schema_summary, indent=2)
+            return knowledge_graph_schema.section_json("schema_summary")
         except Exception as e:
             logger.error(f"Error serving schema summary: {str(e)}")
             raise
@@ -65,7 +139,7 @@ def register_schema_resources(mcp: FastMCP):
         """
         try:
             logger.info("Serving entity types schema")
-            return json.dumps(knowledge_graph_schema.entity_types, indent=2)
+            return knowledge_graph_schema.section_json("entity_types")
         except Exception as e:
             logger.error(f"Error serving entity types: {str(e)}")
             raise
@@ -83,7 +157,7 @@ def register_schema_resources(mcp: FastMCP):
         """
         try:
             logger.info("Serving relationships schema")
-            return json.dumps(knowledge_graph_schema.relationships, indent=2)
+            return knowledge_graph_schema.section_json("relationships")
         except Exception as e:
             logger.error(f"Error serving relationships: {str(e)}")
             raise
@@ -135,89 +209,7 @@ def register_schema_resources(mcp: FastMCP):
         """
         try:
             logger.info("Serving validation guide")
-
-            guide = {
-                "version": "1.0.0",
-                "title": "Knowledge Graph Validation Guide",
-                "sections": {
-                    "entity_creation": {
-                        "description": "Guidelines for creating entities in the knowledge graph",
-                        "rules": [
-                            "All required properties must be provided",
-                            "Property values must match defined data types",
-                            "Unique constraints must be respected",
-                            "Use consistent naming conventions (snake_case for properties)",
-                            "Provide meaningful descriptions for business entities",
-                        ],
-                    },
-                    "relationship_creation": {
-                        "description": "Guidelines for creating relationships between entities",
-                        "rules": [
-                            "Relationships must exist between valid entity type combinations",
-                            "Use predefined relationship types from the schema",
-                            "Ensure directional relationships are created correctly",
-                            "Avoid creating duplicate relationships",
-                            "Include relationship properties when relevant",
-                        ],
-                    },
-                    "data_types": {
-                        "supported_types": [
-                            "string",
-                            "integer",
-                            "float",
-                            "boolean",
-                            "datetime",
-                            "array",
-                            "object",
-                            "enum",
-                        ],
-                        "validation_rules": [
-                            "String properties should have reasonable length limits",
-                            "Enum properties must use predefined values",
-                            "DateTime properties should use ISO 8601 format",
-                            "Array properties should contain homogeneous data types",
-                            "Sensitive properties should be marked and handled appropriately",
-                        ],
-                    },
-                    "best_practices": {
-                        "modeling": [
-                            "Start with core business entities",
-                            "Model relationships that provide business value",
-                            "Use consistent entity and property naming",
-                            "Document complex business rules and calculations",
-                            "Regularly review and update the schema",
-                        ],
-                        "performance": [
-                            "Create indexes on frequently queried properties",
-                            "Use constraints to maintain data integrity",
-                            "Avoid deeply nested relationship chains in queries",
-                            "Consider relationship direction for query optimization",
-                            "Monitor query performance and adjust indexes",
-                        ],
-                    },
-                },
-                "examples": {
-                    "valid_entity": {
-                        "type": "Service",
-                        "properties": {
-                            "name": "user-authentication-service",
-                            "version": "2.1.0",
-                            "description": "Handles user authentication and authorization",
-                            "status": "active",
-                            "created_at": "2024-01-15T10:30:00Z",
-                            "updated_at": "2024-01-20T14:45:00Z",
-                        },
-                    },
-                    "valid_relationship": {
-                        "from_entity": {"type": "Service", "name": "user-service"},
-                        "to_entity": {"type": "Database", "name": "user-db"},
-                        "relationship_type": "OWNS",
-                        "description": "User service owns and manages the user database",
-                    },
-                },
-            }
-
-            return json.dumps(guide, indent=2)
+            return _VALIDATION_GUIDE_JSON
         except Exception as e:
             logger.error(f"Error serving validation guide: {str(e)}")
             raise
@@ -11,6 +11,12 @@ from typing import Any, Dict, List, Optional
 
 import yaml
 
+try:
+    # libyaml's C parser reads the bundled schemas several times faster
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
 
 @dataclass
 class SchemaMetadata:
@@ -74,7 +80,7 @@ class YAMLSchemaLoader:
 
         try:
             with open(schema_file, "r", encoding="utf-8") as f:
-                schema_data = yaml.safe_load(f)
+                schema_data = yaml.load(f, Loader=_SafeLoader)
 
             # Cache the loaded schema
             self.loaded_schemas[schema_name] = schema_data
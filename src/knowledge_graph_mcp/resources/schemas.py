@@ -10,11 +10,23 @@ and domain-specific customization.
 
 import json
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, FrozenSet, List, Tuple
 from .schema_loader import schema_loader
 
 logger = logging.getLogger(__name__)
 
+# Property types a schema may declare, in the order they are documented
+PROPERTY_TYPES: Tuple[str, ...] = (
+    "string",
+    "integer",
+    "float",
+    "boolean",
+    "datetime",
+    "array",
+    "object",
+    "enum",
+)
+
 
 class KnowledgeGraphSchema:
     """
@@ -25,6 +37,25 @@ class KnowledgeGraphSchema:
     customization and domain-specific schemas.
     """
 
+    # One long-lived instance serves every request; fixed slots keep its
+    # attribute reads off a per-instance __dict__
+    __slots__ = (
+        "schema_name",
+        "loader",
+        "schema_data",
+        "entity_types",
+        "relationships",
+        "schema_summary",
+        "entity_names",
+        "required_properties",
+        "relationship_type_set",
+        "relationship_index",
+        "by_entity",
+        "by_from_to",
+        "by_from_type",
+        "_json_cache",
+    )
+
     def __init__(self, schema_name: str = "software_engineering"):
         """
         Initialize with a specific schema.
@@ -41,6 +72,10 @@ class KnowledgeGraphSchema:
             self.entity_types = self.loader.get_entity_types(schema_name)
             self.relationships = self.loader.get_relationships(schema_name)
             self.schema_summary = self.loader.create_schema_summary(schema_name)
+            self._build_entity_indexes()
+            self._build_relationship_indexes()
+            # Serialized sections, filled on first use and dropped on reload
+            self._json_cache: Dict[str, str] = {}
             logger.info(f"Loaded YAML schema: {schema_name}")
         except FileNotFoundError as e:
             logger.error(f"Schema '{schema_name}' not found: {e}")
@@ -49,25 +84,73 @@ class KnowledgeGraphSchema:
             logger.error(f"Error loading schema '{schema_name}': {e}")
             raise
 
+    def _build_entity_indexes(self):
+        """
+        Precompute the entity name set and required properties per type.
+
+        Entity validation runs on every node write; resolving the required
+        properties once at load time spares rebuilding the list per call.
+        """
+        self.entity_names: FrozenSet[str] = frozenset(self.entity_types)
+        self.required_properties: Dict[str, Tuple[str, ...]] = {
+            entity_type: tuple(
+                prop_name
+                for prop_name, prop_def in entity_def.get("properties", {}).items()
+                if prop_def.get("required", False)
+            )
+            for entity_type, entity_def in self.entity_types.items()
+        }
+
+    def _build_relationship_indexes(self):
+        """
+        Index the relationship definitions by the entity types they connect.
+
+        Validation looks relationships up by (from, to), (from, type) and
+        the full (from, to, type) triplet, and schema resources list every
+        relationship touching an entity; building these once at load time
+        keeps each lookup O(1) instead of a scan over every relationship.
+        Definitions missing a from, to or type are left
+        out of every index.
+        """
+        relationship_types = set()
+        self.relationship_index: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+        self.by_entity: Dict[str, List[Dict[str, Any]]] = {}
+        self.by_from_to: Dict[Tuple[str, str], List[str]] = {}
+        self.by_from_type: Dict[Tuple[str, str], List[str]] = {}
+
+        for rel in self.relationships:
+            from_type = rel.get("from")
+            to_type = rel.get("to")
+            rel_type = rel.get("type")
+            if not (from_type and to_type and rel_type):
+                continue  # Incomplete definition, nothing to look it up by
+            relationship_types.add(rel_type)
+            self.relationship_index[(from_type, to_type, rel_type)] = rel
+            self.by_entity.setdefault(from_type, []).append(rel)
+            if to_type != from_type:
+                self.by_entity.setdefault(to_type, []).append(rel)
+            self.by_from_to.setdefault((from_type, to_type), []).append(rel_type)
+            self.by_from_type.setdefault((from_type, rel_type), []).append(to_type)
+        self.relationship_type_set: FrozenSet[str] = frozenset(relationship_types)
+
     def get_entity_schema(self, entity_type: str) -> Dict[str, Any]:
         """Get schema for a specific entity type."""
         return self.entity_types.get(entity_type, {})
 
     def get_relationships_for_entity(self, entity_type: str) -> List[Dict[str, Any]]:
         """Get all possible relationships for a given entity type."""
-        return self.loader.get_relationships_for_entity(self.schema_name, entity_type)
+        # Copy so callers can reorder or extend the list without touching the index
+        return list(self.by_entity.get(entity_type, ()))
 
     def get_relationship_types(self) -> List[str]:
         """Get all unique relationship types."""
-        return self.loader.get_relationship_types(self.schema_name)
+        return list(self.relationship_type_set)
 
     def validate_relationship(
         self, from_entity: str, to_entity: str, relationship_type: str
     ) -> bool:
         """Validate if a relationship is allowed between two entity types."""
-        return self.loader.validate_relationship(
-            self.schema_name, from_entity, to_entity, relationship_type
-        )
+        return (from_entity, to_entity, relationship_type) in self.relationship_index
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert the entire schema to a dictionary."""
@@ -78,8 +161,32 @@ class KnowledgeGraphSchema:
         }
 
     def to_json(self) -> str:
-        """Convert the entire schema to JSON string."""
-        return json.dumps(self.to_dict(), indent=2, default=str)
+        """Convert the entire schema to JSON string (serialized once per load)."""
+        serialized = self._json_cache.get("complete")
+        if serialized is None:
+            serialized = json.dumps(self.to_dict(), indent=2, default=str)
+            self._json_cache["complete"] = serialized
+        return serialized
+
+    def section_json(self, section: str) -> str:
+        """
+        Serialize one schema section to a JSON string.
+
+        The schema does not change until switch_schema reloads it, so each
+        section is serialized on first use and the string reused afterwards.
+
+        Args:
+            section: Attribute to serialize (entity_types, relationships or
+                schema_summary)
+
+        Returns:
+            Indented JSON string of the section
+        """
+        serialized = self._json_cache.get(section)
+        if serialized is None:
+            serialized = json.dumps(getattr(self, section), indent=2)
+            self._json_cache[section] = serialized
+        return serialized
 
     def switch_schema(self, schema_name: str):
         """
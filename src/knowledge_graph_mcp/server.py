@@ -8,6 +8,8 @@ Clean main entry point that registers all resources and tools from modular compo
 
 import asyncio
 import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
 from mcp.server.fastmcp import FastMCP
 
@@ -21,11 +23,27 @@ from .tools.mcp_tools.relationship_tools import register_relationship_tools
 from .tools.mcp_tools.utility_tools import register_utility_tools
 from .tools.mcp_tools.vector_tools import register_vector_tools
 from .utils.index_init import ensure_vector_index_exists
+from .utils.vector_embedding import aclose_client, get_vector_embedding
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("knowledge-graph-mcp")
 
-mcp = FastMCP("knowledge-graph-mcp")
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Warm up the embedding client on startup and close it on shutdown."""
+    try:
+        # Creating the shared instance here starts its background warm-up
+        get_vector_embedding()
+    except Exception as e:
+        logger.warning(f"Embedding client warm-up skipped: {e}")
+    try:
+        yield
+    finally:
+        await aclose_client()
+
+
+mcp = FastMCP("knowledge-graph-mcp", lifespan=lifespan)
 
 
 async def initialize_vector_system():
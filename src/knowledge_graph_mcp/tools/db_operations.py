@@ -9,17 +9,24 @@ import logging
 import os
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
-from typing import Any, ClassVar, Dict, List, LiteralString, Optional, cast
+from typing import Any, ClassVar, Dict, List, LiteralString, Optional, Set, cast
 
 from neo4j import AsyncDriver, AsyncGraphDatabase, AsyncManagedTransaction, AsyncSession
 from neo4j.exceptions import ServiceUnavailable, TransientError
 
 from ..utils.property_filter import clean_properties
 from ..utils.text_extractor import extract_text_from_properties
-from ..utils.vector_embedding import VectorEmbedding
+from ..utils.vector_embedding import get_vector_embedding
 
 logger = logging.getLogger("knowledge-graph-mcp.db_operations")
 
+# URI schemes that connect over TLS
+_ENCRYPTED_SCHEMES = ("neo4j+s://", "bolt+s://")
+
+# Connection settings used when the NEO4J_* variables are not set
+_DEFAULT_URI = "bolt://localhost:7688"
+_DEFAULT_USER = "neo4j"
+
 
 class Neo4jConnector:
     """
@@ -30,12 +37,29 @@ class Neo4jConnector:
     """
 
     _drivers: ClassVar[Dict[str, AsyncDriver]] = {}
+    # Driver resolved from the environment and the config key it was
+    # resolved for; reused while NEO4J_URI and NEO4J_USER still match
+    _default_driver: ClassVar[Optional[AsyncDriver]] = None
+    _default_key: ClassVar[Optional[str]] = None
+    _warmed: ClassVar[Set[str]] = set()
 
     @classmethod
     def _get_config_key(cls, uri: str, user: str) -> str:
         """Generate a unique key for the config to use as cache key."""
         return f"{uri}:{user}"
 
+    @classmethod
+    def _is_encrypted(cls, uri: str) -> bool:
+        """Check whether a URI uses one of the TLS connection schemes."""
+        return uri.startswith(_ENCRYPTED_SCHEMES)
+
+    @classmethod
+    def _get_env_config_key(cls) -> str:
+        """Config key of the environment's connection settings, without logging."""
+        return cls._get_config_key(
+            os.getenv("NEO4J_URI", _DEFAULT_URI), os.getenv("NEO4J_USER", _DEFAULT_USER)
+        )
+
     @classmethod
     def _get_config_from_env(cls) -> tuple[str, str, str]:
         """
@@ -47,8 +71,8 @@ class Neo4jConnector:
         Raises:
             ValueError: If required environment variables are missing
         """
-        uri = os.getenv("NEO4J_URI", "bolt://localhost:7688")
-        user = os.getenv("NEO4J_USER", "neo4j")
+        uri = os.getenv("NEO4J_URI", _DEFAULT_URI)
+        user = os.getenv("NEO4J_USER", _DEFAULT_USER)
         password = os.getenv("NEO4J_PASSWORD", "password")
 
         # Note: Using default password from Docker Compose configuration
@@ -78,6 +102,17 @@ class Neo4jConnector:
         Raises:
             ValueError: If password is not provided and NEO4J_PASSWORD is not set
         """
+        from_env = uri is None and user is None and password is None
+        if from_env and cls._default_driver is not None:
+            # Only trust it while the environment still points at it and it is
+            # still registered (not closed or replaced)
+            env_key = cls._get_env_config_key()
+            if (
+                env_key == cls._default_key
+                and cls._drivers.get(env_key) is cls._default_driver
+            ):
+                return cls._default_driver
+
         # Use provided config or fall back to environment variables
         if uri is None or user is None or password is None:
             env_uri, env_user, env_password = cls._get_config_from_env()
@@ -95,10 +130,14 @@ class Neo4jConnector:
                 max_connection_lifetime=3600,  # 1 hour
                 max_connection_pool_size=50,
                 connection_acquisition_timeout=60,  # 60 seconds
-                encrypted=uri.startswith("neo4j+s://") or uri.startswith("bolt+s://"),
+                encrypted=cls._is_encrypted(uri),
             )
 
-        return cls._drivers[config_key]
+        driver = cls._drivers[config_key]
+        if from_env:
+            cls._default_driver = driver
+            cls._default_key = config_key
+        return driver
 
     @classmethod
     async def close_driver(
@@ -117,6 +156,9 @@ class Neo4jConnector:
             for driver in cls._drivers.values():
                 await driver.close()
             cls._drivers.clear()
+            cls._warmed.clear()
+            cls._default_driver = None
+            cls._default_key = None
         else:
             # Close specific driver
             if uri is None or user is None:
@@ -127,8 +169,12 @@ class Neo4jConnector:
             config_key = cls._get_config_key(uri, user)
             if config_key in cls._drivers:
                 logger.info(f"Closing Neo4j driver for {uri}")
-                await cls._drivers[config_key].close()
-                del cls._drivers[config_key]
+                driver = cls._drivers.pop(config_key)
+                await driver.close()
+                if driver is cls._default_driver:
+                    cls._default_driver = None
+                    cls._default_key = None
+                cls._warmed.discard(config_key)
 
     @classmethod
     @asynccontextmanager
@@ -144,7 +190,8 @@ class Neo4jConnector:
         The session is automatically closed when the context exits.
 
         Args:
-            database: Database name (optional, uses default if not specified)
+            database: Database name (optional, defaults to the NEO4J_DATABASE
+                env var, or the server's default database if that is unset)
             uri: Neo4j URI (optional, uses environment variable if not specified)
             user: Neo4j username (optional, uses environment variable if not specified)
             password: Neo4j password (optional, uses environment variable if not specified)
@@ -157,6 +204,9 @@ class Neo4jConnector:
         ```
         """
         driver = await cls.get_driver(uri, user, password)
+        # Naming the database up front saves the round trip the driver would
+        # otherwise spend resolving the user's home database
+        database = database or os.getenv("NEO4J_DATABASE")
         async with driver.session(database=database) as session:
             yield session
 
@@ -314,6 +364,46 @@ class Neo4jConnector:
             logger.error(f"Neo4j connectivity failed: {type(e).__name__}: {e}")
             return False
 
+    @classmethod
+    async def warm_up(
+        cls,
+        uri: Optional[str] = None,
+        user: Optional[str] = None,
+        password: Optional[str] = None,
+    ) -> None:
+        """
+        Open the first pooled connection for a driver ahead of its first query.
+
+        Meant to be awaited alongside other slow work (such as an embedding
+        call) so that TCP, TLS and authentication happen concurrently rather
+        than in front of the query. Only the first call per driver does any
+        network work; failures are logged and left for the real query to raise.
+
+        Args:
+            uri: Neo4j URI (optional, uses environment variable if not specified)
+            user: Neo4j username (optional, uses environment variable if not specified)
+            password: Neo4j password (optional, uses environment variable if not specified)
+        """
+        if uri is None and user is None and password is None:
+            # get_driver() resolves the same environment driver on its fast path
+            config_key = cls._get_env_config_key()
+        else:
+            if uri is None or user is None or password is None:
+                env_uri, env_user, env_password = cls._get_config_from_env()
+                uri = uri or env_uri
+                user = user or env_user
+                password = password or env_password
+            config_key = cls._get_config_key(uri, user)
+        if config_key in cls._warmed:
+            return
+
+        driver = await cls.get_driver(uri, user, password)
+        try:
+            await driver.verify_connectivity()
+            cls._warmed.add(config_key)
+        except Exception as e:
+            logger.warning(f"Neo4j warm-up failed: {type(e).__name__}: {e}")
+
 
 # High-level database operations for knowledge graph management
 
@@ -349,7 +439,7 @@ async def create_node(
         logger.debug(f"Embedding text for {entity_type}: {embedding_text[:100]}...")
 
         # Generate embedding
-        embedding_util = VectorEmbedding()
+        embedding_util = get_vector_embedding()
         embedding_vector = await embedding_util.embed(embedding_text)
         logger.debug(
             f"Generated embedding vector with {len(embedding_vector)} dimensions"
@@ -10,6 +10,7 @@ from typing import Any, Dict, Optional
 from mcp.server.fastmcp import FastMCP
 
 from ...resources.schemas import knowledge_graph_schema
+from .. import schema_validation
 from ..db_operations import execute_cypher, health_check
 
 logger = logging.getLogger("knowledge-graph-mcp.utility_tools")
@@ -179,74 +180,50 @@ def register_utility_tools(mcp: FastMCP):
         Returns:
             Validation result with success status and any errors
         """
-        try:
-            logger.info(f"Validating entity of type: {entity_type}")
+        logger.info(f"Validating entity of type: {entity_type}")
+        # Same checks as node creation, so the two never disagree
+        return await schema_validation.validate_entity_schema(entity_type, properties)
+
+    @mcp.tool()
+    async def validate_entity_schema_batch( # pyright: ignore
+        entity_type: str, properties_list: str
+    ) -> Dict[str, Any]:
+        """
+        Validate many entities of the same type against the knowledge graph schema.
 
-            # Parse properties
-            parsed_properties = json.loads(properties)
+        Args:
+            entity_type: The type of every entity in the batch
+            properties_list: JSON array of entity property objects
+
+        Returns:
+            Overall validity plus one validation result per entity, in order
+        """
+        try:
+            logger.info(f"Validating batch of entities of type: {entity_type}")
 
-            # Get entity schema
-            entity_schema = knowledge_graph_schema.get_entity_schema(entity_type)
-            if not entity_schema:
+            payloads = json.loads(properties_list)
+            if not isinstance(payloads, list):
                 return {
                     "valid": False,
-                    "errors": [f"Unknown entity type: {entity_type}"],
+                    "errors": ["properties_list must be a JSON array"],
                 }
 
-            errors = []
-            warnings = []
-
-            # Check required properties
-            required_props = [
-                prop_name
-                for prop_name, prop_def in entity_schema.get("properties", {}).items()
-                if prop_def.get("required", False)
-            ]
-
-            for req_prop in required_props:
-                if req_prop not in parsed_properties:
-                    errors.append(f"Missing required property: {req_prop}")
-
-            # Check property types and constraints
-            for prop_name, prop_value in parsed_properties.items():
-                if prop_name in entity_schema.get("properties", {}):
-                    prop_def = entity_schema["properties"][prop_name]
-
-                    # Check enum values
-                    if "enum" in prop_def and prop_value not in prop_def["enum"]:
-                        errors.append(
-                            f"Invalid value for {prop_name}. Must be one of: {prop_def['enum']}"
-                        )
-
-                    # Check data types (basic validation)
-                    expected_type = prop_def.get("type")
-                    if expected_type == "integer" and not isinstance(prop_value, int):
-                        errors.append(f"Property {prop_name} must be an integer")
-                    elif expected_type == "boolean" and not isinstance(
-                        prop_value, bool
-                    ):
-                        errors.append(f"Property {prop_name} must be a boolean")
-                    elif expected_type == "array" and not isinstance(prop_value, list):
-                        errors.append(f"Property {prop_name} must be an array")
-                else:
-                    warnings.append(
-                        f"Property {prop_name} is not defined in schema for {entity_type}"
-                    )
-
+            results = await schema_validation.validate_entity_schema_batch(
+                entity_type, payloads
+            )
             return {
-                "valid": len(errors) == 0,
+                "valid": all(result["valid"] for result in results),
                 "entity_type": entity_type,
-                "errors": errors,
-                "warnings": warnings,
-                "validated_properties": list(parsed_properties.keys()),
+                "results": results,
+                "invalid_count": sum(not result["valid"] for result in results),
             }
 
         except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON in properties: {str(e)}")
-            return {"valid": False, "errors": [f"Invalid JSON in properties: {str(e)}"]}
-        except Exception as e:
-            logger.error(f"Error validating entity: {str(e)}")
-            raise
+            logger.error(f"Invalid JSON in properties_list: {str(e)}")
+            return {
+                "valid": False,
+                "errors": [f"Invalid JSON in properties_list: {str(e)}"],
+            }
 
     @mcp.tool()
     async def validate_relationship( # pyright: ignore
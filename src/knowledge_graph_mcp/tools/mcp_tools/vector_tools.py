@@ -3,20 +3,42 @@ Vector search MCP tools for Knowledge Graph server.
 Handles semantic search and similarity queries using vector embeddings.
 """
 
+import asyncio
 import json
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from mcp.server.fastmcp import FastMCP
 
 from ...utils.property_filter import clean_properties
 from ...utils.text_extractor import extract_text_from_properties
-from ...utils.vector_embedding import VectorEmbedding
+from ...utils.vector_embedding import get_vector_embedding
 from ..db_operations import Neo4jConnector
 
 logger = logging.getLogger("knowledge-graph-mcp.vector_tools")
 
 
+def _format_vector_hits(result: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Format vector index query records into tool result entries.
+
+    Args:
+        result: Records with node_id, labels, properties and score fields
+
+    Returns:
+        List of node dictionaries with cleaned properties and rounded scores
+    """
+    return [
+        {
+            "node_id": record["node_id"],
+            "labels": record["labels"],
+            "properties": clean_properties(record.get("properties", {})),
+            "similarity_score": round(record["score"], 4),
+        }
+        for record in result
+    ]
+
+
 def register_vector_tools(mcp: FastMCP):
     """Register all vector search tools with the MCP server."""
 
@@ -45,7 +67,7 @@ def register_vector_tools(mcp: FastMCP):
             logger.info(f"Vector similarity search for: '{query_text[:50]}...'")
 
             # Generate embedding for query text
-            embedding_util = VectorEmbedding()
+            embedding_util = get_vector_embedding()
             query_vector = await embedding_util.embed(query_text)
 
             # Build entity type filter
@@ -76,17 +98,7 @@ def register_vector_tools(mcp: FastMCP):
                 database,
             )
 
-            # Format results
-            similar_nodes = []
-            for record in result:
-                similar_nodes.append(
-                    {
-                        "node_id": record["node_id"],
-                        "labels": record["labels"],
-                        "properties": clean_properties(record.get("properties", {})),
-                        "similarity_score": round(record["score"], 4),
-                    }
-                )
+            similar_nodes = _format_vector_hits(result)
 
             return {
                 "success": True,
@@ -133,9 +145,11 @@ def register_vector_tools(mcp: FastMCP):
                 entity_type, parsed_properties
             )
 
-            # Generate embedding
-            embedding_util = VectorEmbedding()
-            query_vector = await embedding_util.embed(embedding_text)
+            # Generate embedding while the Neo4j connection is being set up
+            embedding_util = get_vector_embedding()
+            query_vector, _ = await asyncio.gather(
+                embedding_util.embed(embedding_text), Neo4jConnector.warm_up()
+            )
 
             # Find similar entities (excluding same entity type to find relationships)
             query = """
@@ -163,17 +177,7 @@ def register_vector_tools(mcp: FastMCP):
                 database,
             )
 
-            # Format results
-            related_entities = []
-            for record in result:
-                related_entities.append(
-                    {
-                        "node_id": record["node_id"],
-                        "labels": record["labels"],
-                        "properties": clean_properties(record.get("properties", {})),
-                        "similarity_score": round(record["score"], 4),
-                    }
-                )
+            related_entities = _format_vector_hits(result)
 
             return {
                 "success": True,
@@ -226,32 +230,30 @@ def register_vector_tools(mcp: FastMCP):
                 exclude_types = json.loads(exclude_entity_types)
 
             # Generate embedding for query
-            embedding_util = VectorEmbedding()
+            embedding_util = get_vector_embedding()
             query_vector = await embedding_util.embed(query_text)
 
             # Build type filters
             type_conditions = []
             if include_types:
-                sanitized_include = [
-                    t.replace(" ", "").replace("-", "_") for t in include_types
-                ]
-                include_condition = " OR ".join([f"n:{t}" for t in sanitized_include])
+                include_condition = " OR ".join(
+                    f"node:{t.replace(' ', '').replace('-', '_')}"
+                    for t in include_types
+                )
                 type_conditions.append(f"({include_condition})")
-
-            if exclude_types:
-                sanitized_exclude = [
-                    t.replace(" ", "").replace("-", "_") for t in exclude_types
-                ]
-                for exclude_type in sanitized_exclude:
-                    type_conditions.append(f"NOT n:{exclude_type}")
+            type_conditions.extend(
+                f"NOT node:{t.replace(' ', '').replace('-', '_')}"
+                for t in exclude_types
+            )
 
             where_clause = ""
             if type_conditions:
                 where_clause = "AND " + " AND ".join(type_conditions)
 
-            # Vector similarity query across all entities
+            # The label filter runs after the ANN scan, so widen the candidate
+            # window per included type to leave room for each of them
             query = f"""
-            CALL db.index.vector.queryNodes('entity_embedding_index', $limit, $query_vector)
+            CALL db.index.vector.queryNodes('entity_embedding_index', $candidates, $query_vector)
             YIELD node, score
             WHERE score >= $threshold {where_clause}
             RETURN elementId(node) as node_id,
@@ -259,12 +261,14 @@ def register_vector_tools(mcp: FastMCP):
                    properties(node) as properties,
                    score
             ORDER BY score DESC
+            LIMIT $limit
             """
 
             result = await Neo4jConnector.execute_read_query(
                 query,
                 {
                     "query_vector": query_vector,
+                    "candidates": limit * max(1, len(include_types)),
                     "limit": limit,
                     "threshold": threshold,
                 },
@@ -272,28 +276,17 @@ def register_vector_tools(mcp: FastMCP):
             )
 
             # Group results by entity type
+            hits = _format_vector_hits(result)
             results_by_type = {}
-            total_results = 0
 
-            for record in result:
+            for hit in hits:
                 # Get primary entity type (skip 'Entity' base type)
-                labels = record["labels"]
                 entity_type = next(
-                    (label for label in labels if label != "Entity"), "Unknown"
+                    (label for label in hit["labels"] if label != "Entity"), "Unknown"
                 )
+                results_by_type.setdefault(entity_type, []).append(hit)
 
-                if entity_type not in results_by_type:
-                    results_by_type[entity_type] = []
-
-                results_by_type[entity_type].append(
-                    {
-                        "node_id": record["node_id"],
-                        "labels": labels,
-                        "properties": clean_properties(record.get("properties", {})),
-                        "similarity_score": round(record["score"], 4),
-                    }
-                )
-                total_results += 1
+            total_results = len(hits)
 
             return {
                 "success": True,
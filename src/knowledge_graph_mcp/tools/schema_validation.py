@@ -8,13 +8,63 @@ for consistency and reusability across different MCP tools.
 
 import json
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Union
 
 from ..resources.schemas import knowledge_graph_schema
 from .db_operations import execute_cypher
 
 logger = logging.getLogger("knowledge-graph-mcp.schema_validation")
 
+# Schema type name -> (accepted Python types, description used in errors)
+_TYPE_CHECKS = {
+    "integer": (int, "an integer"),
+    "boolean": (bool, "a boolean"),
+    "array": (list, "an array"),
+    "float": ((int, float), "a number"),
+}
+
+
+def _check_entity_properties(
+    entity_type: str, entity_schema: Dict[str, Any], parsed_properties: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Check parsed properties against an entity schema already looked up."""
+    errors = []
+    warnings = []
+
+    # Check required properties (precomputed when the schema is loaded)
+    for req_prop in knowledge_graph_schema.required_properties[entity_type]:
+        if req_prop not in parsed_properties:
+            errors.append(f"Missing required property: {req_prop}")
+
+    # Check property types and constraints
+    schema_properties = entity_schema.get("properties", {})
+    for prop_name, prop_value in parsed_properties.items():
+        prop_def = schema_properties.get(prop_name)
+        if prop_def is None:
+            warnings.append(
+                f"Property {prop_name} is not defined in schema for {entity_type}"
+            )
+            continue
+
+        # Check enum values
+        if "enum" in prop_def and prop_value not in prop_def["enum"]:
+            errors.append(
+                f"Invalid value for {prop_name}. Must be one of: {prop_def['enum']}"
+            )
+
+        # Check data types (basic validation)
+        type_check = _TYPE_CHECKS.get(prop_def.get("type"))
+        if type_check is not None and not isinstance(prop_value, type_check[0]):
+            errors.append(f"Property {prop_name} must be {type_check[1]}")
+
+    return {
+        "valid": len(errors) == 0,
+        "entity_type": entity_type,
+        "errors": errors,
+        "warnings": warnings,
+        "validated_properties": list(parsed_properties.keys()),
+    }
+
 
 async def validate_entity_schema(entity_type: str, properties: str) -> Dict[str, Any]:
     """
@@ -41,55 +91,7 @@ async def validate_entity_schema(entity_type: str, properties: str) -> Dict[str,
         if not entity_schema:
             return {"valid": False, "errors": [f"Unknown entity type: {entity_type}"]}
 
-        errors = []
-        warnings = []
-
-        # Check required properties
-        required_props = [
-            prop_name
-            for prop_name, prop_def in entity_schema.get("properties", {}).items()
-            if prop_def.get("required", False)
-        ]
-
-        for req_prop in required_props:
-            if req_prop not in parsed_properties:
-                errors.append(f"Missing required property: {req_prop}")
-
-        # Check property types and constraints
-        for prop_name, prop_value in parsed_properties.items():
-            if prop_name in entity_schema.get("properties", {}):
-                prop_def = entity_schema["properties"][prop_name]
-
-                # Check enum values
-                if "enum" in prop_def and prop_value not in prop_def["enum"]:
-                    errors.append(
-                        f"Invalid value for {prop_name}. Must be one of: {prop_def['enum']}"
-                    )
-
-                # Check data types (basic validation)
-                expected_type = prop_def.get("type")
-                if expected_type == "integer" and not isinstance(prop_value, int):
-                    errors.append(f"Property {prop_name} must be an integer")
-                elif expected_type == "boolean" and not isinstance(prop_value, bool):
-                    errors.append(f"Property {prop_name} must be a boolean")
-                elif expected_type == "array" and not isinstance(prop_value, list):
-                    errors.append(f"Property {prop_name} must be an array")
-                elif expected_type == "float" and not isinstance(
-                    prop_value, (int, float)
-                ):
-                    errors.append(f"Property {prop_name} must be a number")
-            else:
-                warnings.append(
-                    f"Property {prop_name} is not defined in schema for {entity_type}"
-                )
-
-        return {
-            "valid": len(errors) == 0,
-            "entity_type": entity_type,
-            "errors": errors,
-            "warnings": warnings,
-            "validated_properties": list(parsed_properties.keys()),
-        }
+        return _check_entity_properties(entity_type, entity_schema, parsed_properties)
 
     except json.JSONDecodeError as e:
         return {"valid": False, "errors": [f"Invalid JSON in properties: {str(e)}"]}
@@ -98,6 +100,41 @@ async def validate_entity_schema(entity_type: str, properties: str) -> Dict[str,
         raise
 
 
+async def validate_entity_schema_batch(
+    entity_type: str, payloads: List[Union[str, Dict[str, Any]]]
+) -> List[Dict[str, Any]]:
+    """
+    Validate many entities of the same type against the schema.
+
+    The entity schema is looked up once for the whole batch, and payloads that
+    are already dictionaries skip the JSON round trip.
+
+    Args:
+        entity_type: The type of every entity in the batch
+        payloads: Entity properties, each a JSON string or a dictionary
+
+    Returns:
+        One validation result per payload, in order, shaped like the result
+        of validate_entity_schema
+    """
+    entity_schema = knowledge_graph_schema.get_entity_schema(entity_type)
+    if not entity_schema:
+        unknown = f"Unknown entity type: {entity_type}"
+        return [{"valid": False, "errors": [unknown]} for _ in payloads]
+
+    results = []
+    for payload in payloads:
+        if isinstance(payload, str):
+            try:
+                payload = json.loads(payload)
+            except json.JSONDecodeError as e:
+                error = f"Invalid JSON in properties: {str(e)}"
+                results.append({"valid": False, "errors": [error]})
+                continue
+        results.append(_check_entity_properties(entity_type, entity_schema, payload))
+    return results
+
+
 async def validate_relationship_schema(
     from_node_id: str,
     to_node_id: str,
@@ -132,7 +169,7 @@ async def validate_relationship_schema(
         info = {}
 
         # 1. Check if relationship type exists in schema
-        valid_relationship_types = knowledge_graph_schema.get_relationship_types()
+        valid_relationship_types = knowledge_graph_schema.relationship_type_set
         if relationship_type not in valid_relationship_types:
             errors.append(f"Unknown relationship type: {relationship_type}")
             errors.append(
@@ -146,10 +183,13 @@ async def validate_relationship_schema(
             }
 
         # 2. Get the entity types of the from and to nodes
+        # UNWIND turns this into two elementId lookups instead of a Cartesian
+        # product of two node scans
         node_query = """
-        MATCH (from_node), (to_node)
-        WHERE elementId(from_node) = $from_node_id AND elementId(to_node) = $to_node_id
-        RETURN labels(from_node) as from_labels, labels(to_node) as to_labels
+        UNWIND [{id: $from_node_id, role: 'from'}, {id: $to_node_id, role: 'to'}] AS x
+        MATCH (n)
+        WHERE elementId(n) = x.id
+        RETURN x.role as role, labels(n) as labels
         """
 
         result = await execute_cypher(
@@ -158,7 +198,9 @@ async def validate_relationship_schema(
             database,
         )
 
-        if not result:
+        labels_by_role = {record["role"]: record["labels"] for record in result}
+
+        if "from" not in labels_by_role or "to" not in labels_by_role:
             errors.append("One or both nodes not found")
             return {
                 "valid": False,
@@ -167,8 +209,8 @@ async def validate_relationship_schema(
                 "info": info,
             }
 
-        from_labels = result[0]["from_labels"]
-        to_labels = result[0]["to_labels"]
+        from_labels = labels_by_role["from"]
+        to_labels = labels_by_role["to"]
 
         if not from_labels or not to_labels:
             errors.append("One or both nodes have no labels (entity types)")
@@ -199,18 +241,10 @@ async def validate_relationship_schema(
             )
 
             # Provide helpful suggestions
-            valid_relationships_from = (
-                knowledge_graph_schema.get_relationships_for_entity(from_entity_type)
-            )
-
             # Find valid relationship types between these entity types
-            valid_between = []
-            for rel in valid_relationships_from:
-                if (
-                    rel.get("from") == from_entity_type
-                    and rel.get("to") == to_entity_type
-                ):
-                    valid_between.append(rel.get("type"))
+            valid_between = knowledge_graph_schema.by_from_to.get(
+                (from_entity_type, to_entity_type), []
+            )
 
             if valid_between:
                 errors.append(
@@ -222,13 +256,9 @@ async def validate_relationship_schema(
                 )
 
                 # Suggest valid targets for the relationship type
-                valid_targets = []
-                for rel in knowledge_graph_schema.relationships:
-                    if (
-                        rel.get("from") == from_entity_type
-                        and rel.get("type") == relationship_type
-                    ):
-                        valid_targets.append(rel.get("to"))
+                valid_targets = knowledge_graph_schema.by_from_type.get(
+                    (from_entity_type, relationship_type), []
+                )
 
                 if valid_targets:
                     errors.append(
@@ -297,7 +327,7 @@ def validate_relationship_type_exists(relationship_type: str) -> Dict[str, Any]:
     Returns:
         Dictionary with validation results
     """
-    valid_types = knowledge_graph_schema.get_relationship_types()
+    valid_types = knowledge_graph_schema.relationship_type_set
 
     if relationship_type not in valid_types:
         return {
@@ -349,14 +379,9 @@ def validate_relationship_triplet(
 
     if not is_valid:
         # Find valid alternatives
-        valid_relationships = knowledge_graph_schema.get_relationships_for_entity(
-            from_entity_type
+        valid_between = knowledge_graph_schema.by_from_to.get(
+            (from_entity_type, to_entity_type), []
         )
-        valid_between = [
-            rel.get("type")
-            for rel in valid_relationships
-            if rel.get("from") == from_entity_type and rel.get("to") == to_entity_type
-        ]
 
         error_msg = f"Invalid relationship: {from_entity_type} {relationship_type} {to_entity_type}"
         suggestions = []
@@ -367,12 +392,9 @@ def validate_relationship_triplet(
             )
         else:
             # Find valid targets for this relationship type from this entity
-            valid_targets = [
-                rel.get("to")
-                for rel in knowledge_graph_schema.relationships
-                if rel.get("from") == from_entity_type
-                and rel.get("type") == relationship_type
-            ]
+            valid_targets = knowledge_graph_schema.by_from_type.get(
+                (from_entity_type, relationship_type), []
+            )
             if valid_targets:
                 suggestions.append(
                     f"Valid targets for {from_entity_type} {relationship_type}: {', '.join(set(valid_targets))}"
@@ -3,12 +3,17 @@ Vector index initialization for Knowledge Graph MCP server.
 """
 
 import logging
-from typing import Optional
+from typing import Optional, Set, Tuple
 
 from ..tools.db_operations import Neo4jConnector
 
 logger = logging.getLogger("knowledge-graph-mcp.index_init")
 
+# (database, index_name) pairs already known to exist, so repeated calls skip
+# the SHOW INDEXES round-trip
+_KNOWN_INDEXES: Set[Tuple[Optional[str], str]] = set()
+
+
 async def ensure_vector_index_exists(
     index_name: str = "entity_embedding_index",
     dimensions: int = 384,
@@ -16,18 +21,21 @@ async def ensure_vector_index_exists(
     database: Optional[str] = None,
 ) -> bool:
     """Ensure vector index exists for Entity nodes."""
-    # Check if index exists
+    if (database, index_name) in _KNOWN_INDEXES:
+        return True
+
+    # Fetch every vector index in one round-trip so later checks for other
+    # index names are served from the cache as well
     check_query = """
     SHOW INDEXES YIELD name, type
-    WHERE name = $index_name AND type = 'VECTOR'
-    RETURN count(*) > 0 as exists
+    WHERE type = 'VECTOR'
+    RETURN name
     """
 
-    result = await Neo4jConnector.execute_read_query(
-        check_query, {"index_name": index_name}, database
-    )
+    result = await Neo4jConnector.execute_read_query(check_query, {}, database)
+    _KNOWN_INDEXES.update((database, record["name"]) for record in result)
 
-    if result and result[0].get("exists", False):
+    if (database, index_name) in _KNOWN_INDEXES:
         logger.info(f"Vector index '{index_name}' already exists")
         return True
 
@@ -49,5 +57,6 @@ async def ensure_vector_index_exists(
         database,
     )
 
+    _KNOWN_INDEXES.add((database, index_name))
     logger.info(f"Vector index '{index_name}' created successfully")
     return True
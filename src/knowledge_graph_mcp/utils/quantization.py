@@ -0,0 +1,42 @@
+"""
+Scalar int8 quantization for cached embedding vectors.
+
+Each vector is stored as signed bytes plus a single float scale, a quarter of
+the memory of float32 storage. Dequantized values are within scale / 127 of
+the originals, which is what the int8 embedding cache precision trades away.
+"""
+
+from array import array
+from typing import Sequence, Tuple
+
+_INT8_MAX = 127
+
+
+def quantize_int8(vector: Sequence[float]) -> Tuple[array, float]:
+    """
+    Quantize a float vector to int8 with a per-vector scale.
+
+    Args:
+        vector: Embedding vector to quantize
+
+    Returns:
+        Tuple of (int8 array, scale) where value ~= q * scale / 127
+    """
+    scale = max((abs(v) for v in vector), default=0.0) or 1.0
+    factor = _INT8_MAX / scale
+    return array("b", [round(v * factor) for v in vector]), scale
+
+
+def dequantize_int8(quantized: Sequence[int], scale: float) -> array:
+    """
+    Reconstruct a float32 vector from its int8 form.
+
+    Args:
+        quantized: int8 values produced by quantize_int8
+        scale: Scale returned alongside the quantized values
+
+    Returns:
+        float32 array approximating the original vector
+    """
+    factor = scale / _INT8_MAX
+    return array("f", [q * factor for q in quantized])
@@ -0,0 +1,124 @@
+"""
+Client-side rate limiting for embedding API requests.
+
+Keeps requests under the account's requests-per-minute and tokens-per-minute
+limits and caps the number of requests in flight, so bursts are smoothed out
+locally instead of being rejected with 429s and retried with back-off. All
+waits are asyncio sleeps, so the event loop keeps serving other tasks.
+"""
+
+import asyncio
+import os
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+
+
+class _TokenBucket:
+    """Token bucket refilled continuously at capacity per minute."""
+
+    def __init__(self, per_minute: int):
+        self.capacity = float(per_minute)
+        self._rate = per_minute / 60.0
+        self._level = self.capacity
+        self._updated: float | None = None
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float) -> None:
+        if self._updated is not None:
+            elapsed = now - self._updated
+            self._level = min(self.capacity, self._level + elapsed * self._rate)
+        self._updated = now
+
+    async def acquire(self, amount: float) -> None:
+        """Wait until amount can be taken from the bucket, then take it."""
+        # A single request larger than the bucket would otherwise never fit
+        amount = min(amount, self.capacity)
+        # The lock keeps waiters in FIFO order
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            self._refill(loop.time())
+            while self._level < amount:
+                await asyncio.sleep((amount - self._level) / self._rate)
+                self._refill(loop.time())
+            self._level -= amount
+
+
+class _Pacer:
+    """Spaces calls at least 60 / per_minute seconds apart."""
+
+    def __init__(self, per_minute: int):
+        self.min_interval = 60.0 / per_minute
+        self._last_call: float | None = None
+        self._lock = asyncio.Lock()
+
+    async def wait(self) -> None:
+        """Sleep until the minimum interval since the previous call has passed."""
+        # The lock keeps waiters in FIFO order; other tasks run while we sleep
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            if self._last_call is not None:
+                delay = self._last_call + self.min_interval - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            self._last_call = loop.time()
+
+
+class RateLimiter:
+    """
+    Request, token and concurrency limits for one API client.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: int = 3000,
+        tokens_per_minute: int = 1_000_000,
+        max_concurrency: int = 8,
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            requests_per_minute: Maximum requests started per minute
+            tokens_per_minute: Maximum input tokens sent per minute
+            max_concurrency: Maximum requests in flight at once
+        """
+        # Requests are paced evenly rather than allowed to burst
+        self._requests = _Pacer(requests_per_minute)
+        self._tokens = _TokenBucket(tokens_per_minute)
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    @classmethod
+    def from_env(cls) -> "RateLimiter":
+        """
+        Create a limiter configured from environment variables.
+
+        Reads EMBEDDING_RPM_LIMIT, EMBEDDING_TPM_LIMIT and
+        EMBEDDING_MAX_CONCURRENCY, falling back to the defaults.
+
+        Returns:
+            Configured RateLimiter
+        """
+        return cls(
+            requests_per_minute=int(os.getenv("EMBEDDING_RPM_LIMIT", "3000")),
+            tokens_per_minute=int(os.getenv("EMBEDDING_TPM_LIMIT", "1000000")),
+            max_concurrency=int(os.getenv("EMBEDDING_MAX_CONCURRENCY", "8")),
+        )
+
+    @asynccontextmanager
+    async def slot(self, tokens: int) -> AsyncGenerator[None, None]:
+        """
+        Async context manager held for the duration of one API request.
+
+        Args:
+            tokens: Estimated input tokens of the request
+
+        Usage:
+        ```python
+        async with limiter.slot(estimated_tokens):
+            response = await client.embeddings.create(...)
+        ```
+        """
+        async with self._semaphore:
+            await self._requests.wait()
+            await self._tokens.acquire(tokens)
+            yield
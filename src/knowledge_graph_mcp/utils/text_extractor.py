@@ -2,7 +2,27 @@
 Text extraction utilities for generating embeddings from node properties.
 """
 
-from typing import Any, Dict
+from typing import Any, Dict, Iterator, Tuple
+
+
+def _iter_embeddable(properties: Dict[str, Any]) -> Iterator[Tuple[str, str]]:
+    """
+    Yield the (key, value) pairs that should contribute to an embedding.
+
+    Only non-empty string values are kept, and the embedding vector itself is
+    skipped to avoid recursion.
+
+    Args:
+        properties: Dictionary of node properties
+
+    Returns:
+        Iterator of (key, value) pairs suitable for embedding
+    """
+    return (
+        (key, value)
+        for key, value in properties.items()
+        if key != "embedding_vector" and isinstance(value, str) and value.strip()
+    )
 
 
 def extract_text_from_properties(entity_type: str, properties: Dict[str, Any]) -> str:
@@ -16,21 +36,9 @@ def extract_text_from_properties(entity_type: str, properties: Dict[str, Any]) -
     Returns:
         Formatted text string suitable for embedding generation
     """
-    # Start with entity type as context
+    # Start with entity type as context, then one "key: value" line per property
     text_parts = [f"Entity Type: {entity_type}"]
-
-    # Extract string properties and format them
-    for key, value in properties.items():
-        # Skip non-string values and embedding-related properties
-        if key == "embedding_vector" or not isinstance(value, str):
-            continue
-
-        # Skip empty strings
-        if not value.strip():
-            continue
-
-        # Format as "key: value"
-        text_parts.append(f"{key}: {value}")
+    text_parts.extend(f"{key}: {value}" for key, value in _iter_embeddable(properties))
 
     # Join all parts with newlines for clear structure
     return "\n".join(text_parts)
@@ -46,13 +54,4 @@ def get_embeddable_properties(properties: Dict[str, Any]) -> Dict[str, str]:
     Returns:
         Dictionary containing only string properties suitable for embedding
     """
-    embeddable = {}
-
-    for key, value in properties.items():
-        # Only include string values that are not empty
-        if isinstance(value, str) and value.strip():
-            # Skip embedding-related properties to avoid recursion
-            if key != "embedding_vector":
-                embeddable[key] = value
-
-    return embeddable
+    return dict(_iter_embeddable(properties))
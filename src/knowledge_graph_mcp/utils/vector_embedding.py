@@ -1,19 +1,517 @@
-from openai import AsyncOpenAI
+import asyncio
+import base64
+import hashlib
+import logging
+import os
+import sqlite3
+from array import array
+from collections import OrderedDict
+from functools import cache
+from typing import Awaitable, Callable, Literal, Optional, cast
+
+import httpx
+from openai import (
+    APIConnectionError,
+    AsyncOpenAI,
+    InternalServerError,
+    RateLimitError,
+)
+from tenacity import (
+    AsyncRetrying,
+    RetryCallState,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_random_exponential,
+)
+
+from .quantization import dequantize_int8, quantize_int8
+from .rate_limiter import RateLimiter
+
+try:
+    import tiktoken
+except ImportError:  # optional, installed with the "performance" extra
+    tiktoken = None
+
+logger = logging.getLogger("knowledge-graph-mcp.vector_embedding")
+
+# SQLite caps the number of bound parameters per statement
+_SQLITE_MAX_PARAMS = 900
+
+# Per-request caps of the embeddings endpoint (300k tokens, with headroom)
+_MAX_BATCH_INPUTS = 2048
+_MAX_BATCH_TOKENS = 280_000
+
+# Transient API errors worth retrying, and the jittered back-off between tries
+_RETRYABLE_ERRORS = (RateLimitError, APIConnectionError, InternalServerError)
+_MAX_ATTEMPTS = 6
+_backoff = wait_random_exponential(multiplier=1, max=30)
+
+
+@cache
+def _get_encoding(model: str):
+    """Return the tiktoken encoding for a model, or None if unavailable."""
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except Exception:
+        # Unknown model or the encoding file could not be downloaded
+        return None
+
+
+def _count_tokens(text: str, model: str) -> int:
+    """Count tokens exactly with tiktoken, or estimate ~4 characters per token."""
+    encoding = _get_encoding(model)
+    if encoding is None:
+        return len(text) // 4 + 1
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def _pack_batches(token_counts: list[int]) -> list[tuple[int, int]]:
+    """
+    Greedily split inputs into contiguous (start, end) ranges that each stay
+    within the per-request input and token caps.
+    """
+    ranges = []
+    start, batch_tokens = 0, 0
+    for i, tokens in enumerate(token_counts):
+        if i > start and (
+            i - start >= _MAX_BATCH_INPUTS or batch_tokens + tokens > _MAX_BATCH_TOKENS
+        ):
+            ranges.append((start, i))
+            start, batch_tokens = i, 0
+        batch_tokens += tokens
+    if start < len(token_counts):
+        ranges.append((start, len(token_counts)))
+    return ranges
+
+
+def _decode_embedding(encoded: str) -> array:
+    """Decode a base64 embedding from the API into a float32 array."""
+    vector = array("f")
+    vector.frombytes(base64.b64decode(encoded))
+    return vector
+
+
+def _retry_wait(retry_state: RetryCallState) -> float:
+    """
+    Seconds to wait before the next attempt.
+
+    Rate-limit responses say when to come back in their retry-after-ms or
+    retry-after headers; everything else backs off exponentially with jitter.
+    """
+    if retry_state.outcome is None:
+        return _backoff(retry_state)
+    error = retry_state.outcome.exception()
+    if isinstance(error, RateLimitError):
+        headers = error.response.headers
+        try:
+            if "retry-after-ms" in headers:
+                return float(headers["retry-after-ms"]) / 1000
+            if "retry-after" in headers:
+                return float(headers["retry-after"])
+        except ValueError:
+            pass  # HTTP-date form, fall back to back-off
+    return _backoff(retry_state)
+
+
+@cache
+def _get_client() -> AsyncOpenAI:
+    """
+    Return the process-wide AsyncOpenAI client.
+
+    Every VectorEmbedding shares this client, and with it one httpx
+    connection pool, so TLS connections are reused across instances. HTTP/2
+    lets concurrent requests share a connection instead of each opening
+    its own. Retries are handled in VectorEmbedding._request, so the SDK's
+    own are disabled.
+    """
+    return AsyncOpenAI(
+        max_retries=0,
+        http_client=httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=200,
+                max_keepalive_connections=100,
+                keepalive_expiry=60,
+            ),
+        ),
+    )
+
+
+async def aclose_client() -> None:
+    """
+    Close the shared AsyncOpenAI client, if one was created.
+
+    The instance cached by get_vector_embedding() holds a reference to the
+    client, so it is dropped too and the next call builds a fresh one.
+    """
+    if get_vector_embedding.cache_info().currsize:
+        embedding = get_vector_embedding()
+        get_vector_embedding.cache_clear()
+        if isinstance(embedding, CachedVectorEmbedding):
+            embedding.close()
+    if _get_client.cache_info().currsize:
+        client = _get_client()
+        _get_client.cache_clear()
+        await client.close()
+
+
+class _BatchQueue:
+    """
+    Coalesce concurrent single-text requests into batched calls.
+
+    Texts submitted within max_wait seconds of each other are flushed
+    together (up to max_batch at a time). The worker task only runs while
+    there is queued work, so nothing is left pending between bursts.
+    """
+
+    def __init__(
+        self,
+        flush: Callable[[list[str]], Awaitable[list[array]]],
+        max_batch: int = 256,
+        max_wait: float = 0.01,
+    ):
+        self._flush = flush
+        self._max_batch = max_batch
+        self._max_wait = max_wait
+        self._pending: list[tuple[str, asyncio.Future]] = []
+        self._worker: Optional[asyncio.Task] = None
+        self._dispatches: set[asyncio.Task] = set()
+
+    def submit(self, text: str) -> asyncio.Future:
+        """Queue a text and return a future resolving to its embedding."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((text, future))
+        if self._worker is None or self._worker.done():
+            self._worker = loop.create_task(self._run())
+        return future
+
+    async def _run(self) -> None:
+        while self._pending:
+            await asyncio.sleep(self._max_wait)
+            while self._pending:
+                batch = self._pending[: self._max_batch]
+                del self._pending[: self._max_batch]
+                # Dispatch without awaiting so the next window keeps collecting
+                task = asyncio.create_task(self._dispatch(batch))
+                self._dispatches.add(task)
+                task.add_done_callback(self._dispatches.discard)
+
+    async def _dispatch(self, batch: list[tuple[str, asyncio.Future]]) -> None:
+        batch = [(text, future) for text, future in batch if not future.done()]
+        if not batch:
+            return
+
+        try:
+            vectors = await self._flush([text for text, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), vector in zip(batch, vectors):
+            if not future.done():
+                future.set_result(vector)
 
 
 class VectorEmbedding:
-    def __init__(self, dimension: int = 384):
-        self.client = AsyncOpenAI()
+    """
+    OpenAI embedding client.
+
+    Vectors are held internally as packed float32 arrays (4 bytes per value
+    instead of a Python float object). The embed methods return plain lists
+    by default, which is what the Neo4j driver accepts; pass as_list=False
+    to get the float32 arrays without the conversion.
+    """
+
+    model = "text-embedding-3-small"
+
+    # Embedded by the warm-up task; one token, so it costs next to nothing
+    _WARMUP_TEXT = "warmup"
+
+    def __init__(
+        self, dimension: int = 384, cache_size: int = 4096, warm_up: bool = False
+    ):
+        self.client = _get_client()
         self.dimension = dimension
+        # Concurrent embed() calls are sent to the API as one batch
+        self._batcher = _BatchQueue(self._embed_arrays)
+        self._rate_limiter = RateLimiter.from_env()
+        # In-process LRU of recent embed() results, keyed by (text, dimension, model)
+        self._lru: OrderedDict[tuple[str, int, str], array] = OrderedDict()
+        self._cache_size = cache_size
+        self._hits = 0
+        self._misses = 0
+
+        # Open the connection and authenticate in the background so the first
+        # real request does not pay for the TLS handshake
+        self._warmup_task: Optional[asyncio.Task] = None
+        if warm_up:
+            try:
+                self._warmup_task = asyncio.get_running_loop().create_task(
+                    self._warmup()
+                )
+            except RuntimeError:
+                pass  # No running loop, the first request warms up instead
+
+    async def _warmup(self) -> None:
+        # Straight to the API: a cache hit would leave the connection unopened
+        try:
+            await self._request([self._WARMUP_TEXT], 1)
+        except Exception as e:
+            logger.warning(f"Embedding warm-up failed: {e}")
+
+    async def embed(self, text: str, as_list: bool = True) -> list[float] | array:
+        key = (text, self.dimension, self.model)
+        vector = self._lru.get(key)
+        if vector is not None:
+            self._lru.move_to_end(key)
+            self._hits += 1
+        else:
+            self._misses += 1
+            vector = await self._batcher.submit(text)
+            self._lru[key] = vector
+            if len(self._lru) > self._cache_size:
+                self._lru.popitem(last=False)
+
+        # Hand out a copy so callers cannot mutate the cached vector
+        return vector.tolist() if as_list else array("f", vector)
+
+    async def batch_embed(
+        self, texts: list[str], as_list: bool = True
+    ) -> list[list[float]] | list[array]:
+        vectors = await self._embed_arrays(texts)
+        return [vector.tolist() for vector in vectors] if as_list else vectors
+
+    async def _embed_arrays(self, texts: list[str]) -> list[array]:
+        """Embed texts as float32 arrays, one independent array per text."""
+        # Repeated texts are sent once and their vector reused for every copy
+        unique_texts = list(dict.fromkeys(texts))
+        token_counts = [_count_tokens(text, self.model) for text in unique_texts]
+        unique_vectors = await self._embed_counted(unique_texts, token_counts)
+        if len(unique_texts) == len(texts):
+            return unique_vectors
+        by_text = dict(zip(unique_texts, unique_vectors))
+        # Copy so duplicated texts never share one mutable array
+        return [array("f", by_text[text]) for text in texts]
+
+    async def _embed_counted(
+        self, texts: list[str], token_counts: list[int]
+    ) -> list[array]:
+        """Embed texts whose token counts are already known."""
+        # Split oversized payloads into sub-batches under the API caps and
+        # send them concurrently; contiguous ranges keep the input order
+        results = await asyncio.gather(
+            *(
+                self._request(texts[start:end], sum(token_counts[start:end]))
+                for start, end in _pack_batches(token_counts)
+            )
+        )
+        return [vector for vectors in results for vector in vectors]
+
+    async def _request(self, texts: list[str], tokens: int) -> list[array]:
+        """
+        Send one embeddings request within the rate limits.
+
+        Transient failures (429, 5xx, connection errors) are retried up to
+        _MAX_ATTEMPTS times. Each attempt takes a fresh rate-limiter slot, so
+        the wait between attempts does not hold up other requests.
+        """
+        vectors: list[array] = []
+        async for attempt in AsyncRetrying(
+            retry=retry_if_exception_type(_RETRYABLE_ERRORS),
+            wait=_retry_wait,
+            stop=stop_after_attempt(_MAX_ATTEMPTS),
+            reraise=True,
+        ):
+            with attempt:
+                async with self._rate_limiter.slot(tokens):
+                    # Ask for base64 explicitly: the SDK then hands back the
+                    # raw float32 bytes instead of expanding them into a list
+                    response = await self.client.embeddings.create(
+                        input=texts,
+                        model=self.model,
+                        dimensions=self.dimension,
+                        encoding_format="base64",
+                    )
+                # The SDK types embedding as List[float], but with
+                # encoding_format="base64" it is the encoded string
+                vectors = [
+                    _decode_embedding(cast(str, data.embedding))
+                    for data in response.data
+                ]
+        return vectors
+
+    def stats(self) -> dict[str, int]:
+        """Return hit/miss counters and current size of the embed() LRU."""
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "size": len(self._lru),
+            "maxsize": self._cache_size,
+        }
+
+
+class CachedVectorEmbedding(VectorEmbedding):
+    """
+    VectorEmbedding backed by a persistent SQLite cache.
+
+    Vectors are keyed by blake2b(model|dimension|text) and stored as packed
+    float32 bytes, so identical texts are only sent to the API once, even
+    across process restarts. With precision="int8" new vectors are stored
+    as a float32 scale followed by one signed byte per dimension, a quarter
+    of the size, and are dequantized when read back.
+    """
 
-    async def embed(self, text: str) -> list[float]:
-        response = await self.client.embeddings.create(
-            input=text, model="text-embedding-3-small", dimensions=self.dimension
+    def __init__(
+        self,
+        cache_path: str,
+        dimension: int = 384,
+        precision: Literal["fp32", "int8"] = "fp32",
+        warm_up: bool = False,
+    ):
+        """
+        Initialize the embedding client and open the cache database.
+
+        Args:
+            cache_path: Path of the SQLite cache file (created if missing)
+            dimension: Embedding dimension to request from the API
+            precision: Storage format of newly cached vectors; "fp32" keeps
+                them exact, "int8" trades a little precision for 4x less space
+            warm_up: Send a tiny request in the background when created
+                inside a running event loop
+        """
+        if precision not in ("fp32", "int8"):
+            raise ValueError(f"Unsupported precision: {precision}")
+        super().__init__(dimension, warm_up=warm_up)
+        self.precision = precision
+        self._db = sqlite3.connect(cache_path)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings (hash BLOB PRIMARY KEY, vec BLOB NOT NULL)"
         )
-        return response.data[0].embedding
+        self._db.commit()
+
+    def _prepare(self, texts: list[str]) -> tuple[list[bytes], list[int]]:
+        """
+        Compute the cache key and token count of every text in one pass.
 
-    async def batch_embed(self, texts: list[str]) -> list[list[float]]:
-        response = await self.client.embeddings.create(
-            input=texts, model="text-embedding-3-small", dimensions=self.dimension
+        Keys are 16-byte blake2b digests; collision resistance only needs to
+        hold for cache lookups, so the shorter, faster hash is enough. The
+        model|dimension prefix is hashed once and the hasher state copied
+        for each text, rather than rehashing a concatenated copy.
+        """
+        prefix = hashlib.blake2b(
+            f"{self.model}|{self.dimension}|".encode("utf-8"), digest_size=16
         )
-        return [data.embedding for data in response.data]
+        keys, token_counts = [], []
+        for text in texts:
+            hasher = prefix.copy()
+            hasher.update(text.encode("utf-8"))
+            keys.append(hasher.digest())
+            token_counts.append(_count_tokens(text, self.model))
+        return keys, token_counts
+
+    def _load(self, keys: list[bytes]) -> dict[bytes, array]:
+        """Fetch the cached vectors for the given keys."""
+        found = {}
+        unique_keys = list(dict.fromkeys(keys))
+        for start in range(0, len(unique_keys), _SQLITE_MAX_PARAMS):
+            chunk = unique_keys[start : start + _SQLITE_MAX_PARAMS]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self._db.execute(
+                f"SELECT hash, vec FROM embeddings WHERE hash IN ({placeholders})",
+                chunk,
+            )
+            for key, blob in rows:
+                found[key] = self._decode(blob)
+        return found
+
+    def _encode(self, vector: array) -> bytes:
+        """Serialize a vector in the configured precision."""
+        if self.precision == "fp32":
+            return vector.tobytes()
+        quantized, scale = quantize_int8(vector)
+        return array("f", [scale]).tobytes() + quantized.tobytes()
+
+    def _decode(self, blob: bytes) -> array:
+        """
+        Deserialize a cached vector.
+
+        The format is told apart by length (4 bytes per value for float32,
+        a 4-byte scale plus 1 byte per value for int8), so a cache file
+        written with either precision can be read with the other.
+        """
+        if len(blob) == 4 * self.dimension:
+            vector = array("f")
+            vector.frombytes(blob)
+            return vector
+        scale = array("f")
+        scale.frombytes(blob[:4])
+        quantized = array("b")
+        quantized.frombytes(blob[4:])
+        return dequantize_int8(quantized, scale[0])
+
+    def _store(self, entries: dict[bytes, array]) -> None:
+        """Persist newly computed vectors."""
+        self._db.executemany(
+            "INSERT OR IGNORE INTO embeddings (hash, vec) VALUES (?, ?)",
+            [(key, self._encode(vector)) for key, vector in entries.items()],
+        )
+        self._db.commit()
+
+    async def _embed_arrays(self, texts: list[str]) -> list[array]:
+        keys, token_counts = self._prepare(texts)
+        vectors = self._load(keys)
+
+        # Only texts that are not cached yet go to the API
+        misses = {
+            key: (text, tokens)
+            for key, text, tokens in zip(keys, texts, token_counts)
+            if key not in vectors
+        }
+        if misses:
+            miss_texts, miss_tokens = zip(*misses.values())
+            fresh = await self._embed_counted(list(miss_texts), list(miss_tokens))
+            computed = dict(zip(misses, fresh))
+            self._store(computed)
+            vectors.update(computed)
+
+        # Copy so duplicated texts never share one mutable array
+        return [array("f", vectors[key]) for key in keys]
+
+    def close(self) -> None:
+        """Close the cache database."""
+        self._db.close()
+
+
+@cache
+def get_vector_embedding() -> VectorEmbedding:
+    """
+    Get the process-wide VectorEmbedding instance.
+
+    The instance is created on first use rather than at import so that
+    importing the tools does not require OpenAI credentials. When
+    EMBEDDING_CACHE_PATH is set, embeddings are cached on disk at that path,
+    in the precision given by EMBEDDING_CACHE_PRECISION ("fp32" or "int8").
+    When created inside the server's event loop, a warm-up request is sent
+    in the background.
+
+    Returns:
+        Shared VectorEmbedding instance
+
+    Raises:
+        ValueError: If EMBEDDING_CACHE_PRECISION is not "fp32" or "int8"
+    """
+    cache_path = os.getenv("EMBEDDING_CACHE_PATH")
+    if cache_path:
+        precision = os.getenv("EMBEDDING_CACHE_PRECISION", "fp32")
+        if precision not in ("fp32", "int8"):
+            raise ValueError(
+                f"EMBEDDING_CACHE_PRECISION must be 'fp32' or 'int8', "
+                f"got {precision!r}"
+            )
+        return CachedVectorEmbedding(cache_path, precision=precision, warm_up=True)
+    return VectorEmbedding(warm_up=True)
@@ -2,19 +2,23 @@
 Pytest configuration and shared fixtures for Knowledge Graph MCP tests.
 """
 
-import asyncio
 from typing import Any, Dict
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
+try:
+    import uvloop
+except ImportError:  # Optional, from the performance extra (Unix only)
+    uvloop = None
 
-@pytest.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+
+if uvloop is not None:
+
+    @pytest.fixture(scope="session")
+    def event_loop_policy():
+        """Run async tests on uvloop's libuv event loop when it is installed."""
+        return uvloop.EventLoopPolicy()
 
 
 @pytest.fixture
@@ -62,6 +66,17 @@ def mock_session():
     return mock_session
 
 
+@pytest.fixture
+def mock_session_ctx():
+    """Patch Neo4jConnector.get_session to yield a MockNeo4jSession."""
+    session = MockNeo4jSession()
+    with patch(
+        "knowledge_graph_mcp.tools.db_operations.Neo4jConnector.get_session",
+        return_value=session,
+    ):
+        yield session
+
+
 @pytest.fixture
 def sample_node_data():
     """Sample node data for testing."""
@@ -144,3 +159,42 @@ class MockNeo4jTransaction:
     ) -> MockNeo4jResult:
         """Mock transaction run method."""
         return MockNeo4jResult(self.result_data)
+
+
+class MockNeo4jSession:
+    """
+    Mock Neo4j session object.
+
+    Hand-rolled rather than an AsyncMock so tests skip the child-mock
+    bookkeeping; every query run is recorded in calls instead.
+    """
+
+    def __init__(
+        self,
+        result_data: list[Dict[str, Any]] | None = None,
+        error: Exception | None = None,
+    ):
+        self.result_data = result_data or []
+        self.error = error
+        self.calls: list[tuple[str, Dict[str, Any]]] = []
+
+    async def __aenter__(self) -> "MockNeo4jSession":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+
+    async def run(
+        self, query: str, parameters: Dict[str, Any] = None
+    ) -> MockNeo4jResult:
+        """Record the query and return the configured data or raise the error."""
+        self.calls.append((query, parameters))
+        if self.error is not None:
+            raise self.error
+        return MockNeo4jResult(self.result_data)
+
+    async def execute_write(self, work, *args, **kwargs):
+        """Run the transaction function with the session as its transaction."""
+        return await work(self, *args, **kwargs)
+
+    execute_read = execute_write
@@ -3,7 +3,7 @@ Unit tests for high-level database operations.
 Tests create_node, create_relationship, query_nodes, etc. with mocking.
 """
 
-from unittest.mock import patch
+from unittest.mock import DEFAULT, patch
 
 import pytest
 from knowledge_graph_mcp.tools.db_operations import (
@@ -263,28 +263,32 @@ class TestDatabaseOperations:
             mock_execute_write.reset_mock()
 
     @pytest.mark.asyncio
-    @patch("knowledge_graph_mcp.tools.db_operations.Neo4jConnector.verify_connectivity")
-    async def test_health_check_success(self, mock_verify):
+    async def test_health_check_success(self, mocker):
         """Test successful health check."""
-        mock_verify.return_value = True
-
-        with patch(
-            "knowledge_graph_mcp.tools.db_operations.Neo4jConnector.execute_read_query"
-        ) as mock_read:
-            mock_read.return_value = [{"node_count": 10, "relationship_count": 5}]
+        mocks = mocker.patch.multiple(
+            "knowledge_graph_mcp.tools.db_operations.Neo4jConnector",
+            verify_connectivity=DEFAULT,
+            execute_read_query=DEFAULT,
+        )
+        mocks["verify_connectivity"].return_value = True
+        mocks["execute_read_query"].return_value = [
+            {"node_count": 10, "relationship_count": 5}
+        ]
 
-            result = await health_check()
+        result = await health_check()
 
-            assert result["status"] == "healthy"
-            assert result["connected"] is True
-            assert result["node_count"] == 10
-            assert result["relationship_count"] == 5
+        assert result["status"] == "healthy"
+        assert result["connected"] is True
+        assert result["node_count"] == 10
+        assert result["relationship_count"] == 5
 
     @pytest.mark.asyncio
-    @patch("knowledge_graph_mcp.tools.db_operations.Neo4jConnector.verify_connectivity")
-    async def test_health_check_connection_failure(self, mock_verify):
+    async def test_health_check_connection_failure(self, mocker):
         """Test health check with connection failure."""
-        mock_verify.return_value = False
+        mocker.patch(
+            "knowledge_graph_mcp.tools.db_operations.Neo4jConnector.verify_connectivity",
+            return_value=False,
+        )
 
         result = await health_check()
 
@@ -293,25 +297,25 @@ class TestDatabaseOperations:
         assert "error" in result
 
     @pytest.mark.asyncio
-    @patch("knowledge_graph_mcp.tools.db_operations.Neo4jConnector.verify_connectivity")
-    async def test_health_check_stats_fallback(self, mock_verify):
+    async def test_health_check_stats_fallback(self, mocker):
         """Test health check with stats query fallback."""
-        mock_verify.return_value = True
-
-        with patch(
-            "knowledge_graph_mcp.tools.db_operations.Neo4jConnector.execute_read_query"
-        ) as mock_read:
-            # First call fails (stats not available), second call succeeds (fallback)
-            mock_read.side_effect = [
-                Exception("Stats not available"),
-                [{"node_count": 8}],
-            ]
+        mocks = mocker.patch.multiple(
+            "knowledge_graph_mcp.tools.db_operations.Neo4jConnector",
+            verify_connectivity=DEFAULT,
+            execute_read_query=DEFAULT,
+        )
+        mocks["verify_connectivity"].return_value = True
+        # First call fails (stats not available), second call succeeds (fallback)
+        mocks["execute_read_query"].side_effect = [
+            Exception("Stats not available"),
+            [{"node_count": 8}],
+        ]
 
-            result = await health_check()
+        result = await health_check()
 
-            assert result["status"] == "healthy"
-            assert result["node_count"] == 8
-            assert result["relationship_count"] == "unknown"
+        assert result["status"] == "healthy"
+        assert result["node_count"] == 8
+        assert result["relationship_count"] == "unknown"
 
     @pytest.mark.asyncio
     @patch("knowledge_graph_mcp.tools.db_operations.Neo4jConnector.close_driver")
@@ -451,18 +455,18 @@ class TestDatabaseOperations:
             assert result[1]["entity_type"] is None  # No labels
 
     @pytest.mark.asyncio
-    async def test_health_check_exception_handling(self):
+    async def test_health_check_exception_handling(self, mocker):
         """Test health check exception handling."""
-        with patch(
-            "knowledge_graph_mcp.tools.db_operations.Neo4jConnector.verify_connectivity"
-        ) as mock_verify:
-            mock_verify.side_effect = Exception("Connection timeout")
+        mocker.patch(
+            "knowledge_graph_mcp.tools.db_operations.Neo4jConnector.verify_connectivity",
+            side_effect=Exception("Connection timeout"),
+        )
 
-            result = await health_check()
+        result = await health_check()
 
-            assert result["status"] == "unhealthy"
-            assert result["connected"] is False
-            assert "Connection timeout" in result["error"]
+        assert result["status"] == "unhealthy"
+        assert result["connected"] is False
+        assert "Connection timeout" in result["error"]
 
 
 class TestEdgeCases:
@@ -3,55 +3,161 @@ Unit tests for MCP server resources and tools.
 Tests the MCP server endpoints and resource serving.
 """
 
+import asyncio
 import json
+from collections import Counter
+from functools import partial
+from operator import itemgetter
 
 import pytest
+from knowledge_graph_mcp.resources.mcp_resources import register_schema_resources
 from knowledge_graph_mcp.resources.schemas import knowledge_graph_schema
-from knowledge_graph_mcp.server import (
-    get_complete_schema,
-    get_entity_schema,
-    get_entity_types,
-    get_relationships,
-    get_schema_summary,
-    get_validation_guide,
-    validate_entity_schema,
-    validate_relationship,
+from knowledge_graph_mcp.tools import schema_validation
+from knowledge_graph_mcp.tools.mcp_tools.utility_tools import register_utility_tools
+from mcp.server.fastmcp import FastMCP
+
+
+# The handlers are closures inside the register_* functions, so the tests
+# serve them from a throwaway server through FastMCP's public API
+_server = FastMCP("knowledge-graph-mcp-test")
+register_schema_resources(_server)
+register_utility_tools(_server)
+_SCHEMA_URI = "knowledge-graph://schema"
+
+
+async def _read_resource(uri):
+    (contents,) = await _server.read_resource(uri)
+    return contents.content
+
+
+async def _call_tool(name, **arguments):
+    _, structured = await _server.call_tool(name, arguments)
+    return structured["result"]
+
+
+get_complete_schema = partial(_read_resource, f"{_SCHEMA_URI}/complete")
+get_entity_types = partial(_read_resource, f"{_SCHEMA_URI}/entities")
+get_relationships = partial(_read_resource, f"{_SCHEMA_URI}/relationships")
+get_schema_summary = partial(_read_resource, f"{_SCHEMA_URI}/summary")
+get_validation_guide = partial(_read_resource, f"{_SCHEMA_URI}/validation-guide")
+
+
+async def get_entity_schema(entity_type):
+    return await _read_resource(f"{_SCHEMA_URI}/entity/{entity_type}")
+
+
+async def validate_entity_schema(entity_type, properties):
+    return await _call_tool(
+        "validate_entity_schema", entity_type=entity_type, properties=properties
+    )
+
+
+async def validate_entity_schema_batch(entity_type, properties_list):
+    return await _call_tool(
+        "validate_entity_schema_batch",
+        entity_type=entity_type,
+        properties_list=properties_list,
+    )
+
+
+async def validate_relationship(from_entity_type, to_entity_type, relationship_type):
+    return await _call_tool(
+        "validate_relationship",
+        from_entity_type=from_entity_type,
+        to_entity_type=to_entity_type,
+        relationship_type=relationship_type,
+    )
+
+
+# Entity payloads are serialized once at import rather than in every test
+_VALID_SERVICE = json.dumps(
+    {
+        "name": "test-service",
+        "version": "1.0.0",
+        "status": "active",
+        "created_at": "2024-01-01T00:00:00Z",
+        "updated_at": "2024-01-01T00:00:00Z",
+    }
+)
+_MISSING_REQUIRED = json.dumps(
+    {
+        "version": "1.0.0",
+        "status": "active",
+        # Missing required 'name', 'created_at', 'updated_at'
+    }
+)
+_INVALID_ENUM = json.dumps(
+    {
+        "name": "test-service",
+        "status": "invalid_status",  # Invalid enum value
+        "created_at": "2024-01-01T00:00:00Z",
+        "updated_at": "2024-01-01T00:00:00Z",
+    }
+)
+_INVALID_FLOAT = json.dumps(
+    {
+        "name": "core",
+        "path": "src/core",
+        "language": "python",
+        "complexity_score": "high",  # Must be a number
+    }
+)
+_INVALID_JSON = "{ invalid json structure"
+_UNKNOWN_ENTITY = json.dumps({"name": "test"})
+_EXTRA_PROPS = json.dumps(
+    {
+        "name": "test-service",
+        "status": "active",
+        "created_at": "2024-01-01T00:00:00Z",
+        "updated_at": "2024-01-01T00:00:00Z",
+        "extra_property": "not_in_schema",
+    }
 )
 
 
 class TestMCPServerResources:
     """Test cases for MCP server resource endpoints."""
 
-    @pytest.mark.asyncio
-    async def test_get_complete_schema(self):
-        """Test complete schema resource."""
-        result = await get_complete_schema()
+    @pytest.fixture(scope="class")
+    async def resources(self):
+        """Fetch the static resources concurrently and parse each once."""
+        names = (
+            "complete_schema",
+            "schema_summary",
+            "entity_types",
+            "relationships",
+            "validation_guide",
+        )
+        results = await asyncio.gather(
+            get_complete_schema(),
+            get_schema_summary(),
+            get_entity_types(),
+            get_relationships(),
+            get_validation_guide(),
+        )
+        # json.loads doubles as the "returns valid JSON" check
+        return {name: json.loads(result) for name, result in zip(names, results)}
 
-        # Should return valid JSON
-        parsed = json.loads(result)
+    def test_get_complete_schema(self, resources):
+        """Test complete schema resource."""
+        parsed = resources["complete_schema"]
 
         assert "entity_types" in parsed
         assert "relationships" in parsed
         assert "schema_summary" in parsed
 
-    @pytest.mark.asyncio
-    async def test_get_schema_summary(self):
+    def test_get_schema_summary(self, resources):
         """Test schema summary resource."""
-        result = await get_schema_summary()
-
-        parsed = json.loads(result)
+        parsed = resources["schema_summary"]
 
-        assert "version" in parsed
+        assert "version" in parsed["metadata"]
         assert "statistics" in parsed
         assert "entity_categories" in parsed
         assert "relationship_types" in parsed
 
-    @pytest.mark.asyncio
-    async def test_get_entity_types(self):
+    def test_get_entity_types(self, resources):
         """Test entity types resource."""
-        result = await get_entity_types()
-
-        parsed = json.loads(result)
+        parsed = resources["entity_types"]
 
         # Should contain known entity types
         assert "Service" in parsed
@@ -63,12 +169,9 @@ class TestMCPServerResources:
         assert "description" in service_def
         assert "properties" in service_def
 
-    @pytest.mark.asyncio
-    async def test_get_relationships(self):
+    def test_get_relationships(self, resources):
         """Test relationships resource."""
-        result = await get_relationships()
-
-        parsed = json.loads(result)
+        parsed = resources["relationships"]
 
         assert isinstance(parsed, list)
         assert len(parsed) > 0
@@ -103,12 +206,9 @@ class TestMCPServerResources:
         with pytest.raises(ValueError, match="Entity type 'InvalidEntity' not found"):
             await get_entity_schema("InvalidEntity")
 
-    @pytest.mark.asyncio
-    async def test_get_validation_guide(self):
+    def test_get_validation_guide(self, resources):
         """Test validation guide resource."""
-        result = await get_validation_guide()
-
-        parsed = json.loads(result)
+        parsed = resources["validation_guide"]
 
         assert "title" in parsed
         assert "sections" in parsed
@@ -131,112 +231,116 @@ class TestMCPServerTools:
     """Test cases for MCP server tool endpoints."""
 
     @pytest.mark.asyncio
-    async def test_validate_entity_schema_valid(self):
-        """Test entity schema validation with valid data."""
-        properties = json.dumps(
-            {
-                "name": "test-service",
-                "version": "1.0.0",
-                "status": "active",
-                "created_at": "2024-01-01T00:00:00Z",
-                "updated_at": "2024-01-01T00:00:00Z",
-            }
-        )
+    @pytest.mark.parametrize(
+        ("entity_type", "payload", "valid", "error_terms", "warning_terms"),
+        [
+            ("Service", _VALID_SERVICE, True, (), ()),
+            (
+                "Service",
+                _MISSING_REQUIRED,
+                False,
+                ("name", "created_at", "updated_at"),
+                (),
+            ),
+            ("Service", _INVALID_ENUM, False, ("status", "active"), ()),
+            ("Module", _INVALID_FLOAT, False, ("complexity_score", "a number"), ()),
+            ("Service", _INVALID_JSON, False, ("JSON",), ()),
+            ("UnknownEntity", _UNKNOWN_ENTITY, False, ("Unknown entity type",), ()),
+            # Extra properties are valid but produce warnings
+            ("Service", _EXTRA_PROPS, True, (), ("extra_property",)),
+        ],
+        ids=[
+            "valid",
+            "missing_required",
+            "invalid_enum",
+            "invalid_float",
+            "invalid_json",
+            "unknown_entity",
+            "extra_props",
+        ],
+    )
+    async def test_validate_entity_schema(
+        self, entity_type, payload, valid, error_terms, warning_terms
+    ):
+        """Test entity schema validation across valid and invalid payloads."""
+        result = await validate_entity_schema(entity_type, payload)
+
+        assert result["valid"] is valid
+        if valid:
+            assert len(result["errors"]) == 0
+            assert result["entity_type"] == entity_type
+            assert set(json.loads(payload)) <= set(result["validated_properties"])
+        else:
+            assert len(result["errors"]) > 0
 
-        result = await validate_entity_schema("Service", properties)
+        error_text = " ".join(result["errors"])
+        for term in error_terms:
+            assert term in error_text
 
-        assert result["valid"] is True
-        assert result["entity_type"] == "Service"
-        assert len(result["errors"]) == 0
-        assert "name" in result["validated_properties"]
+        warning_text = " ".join(result.get("warnings", []))
+        for term in warning_terms:
+            assert term in warning_text
 
     @pytest.mark.asyncio
-    async def test_validate_entity_schema_missing_required(self):
-        """Test entity schema validation with missing required properties."""
-        properties = json.dumps(
-            {
-                "version": "1.0.0",
-                "status": "active",
-                # Missing required 'name', 'created_at', 'updated_at'
-            }
+    async def test_validate_entity_schema_batch(self):
+        """Test batch validation matches validating each payload on its own."""
+        payloads = [
+            _VALID_SERVICE,
+            _MISSING_REQUIRED,
+            _INVALID_ENUM,
+            _INVALID_JSON,
+            _EXTRA_PROPS,
+            json.loads(_VALID_SERVICE),
+        ] * 20
+
+        results = await schema_validation.validate_entity_schema_batch(
+            "Service", payloads
         )
 
-        result = await validate_entity_schema("Service", properties)
-
-        assert result["valid"] is False
-        assert len(result["errors"]) > 0
-
-        # Should have errors for missing required properties
-        error_text = " ".join(result["errors"])
-        assert "name" in error_text
-        assert "created_at" in error_text
-        assert "updated_at" in error_text
+        assert len(results) == len(payloads)
+        for payload, result in zip(payloads, results):
+            if not isinstance(payload, str):
+                payload = json.dumps(payload)
+            assert result == await schema_validation.validate_entity_schema(
+                "Service", payload
+            )
 
     @pytest.mark.asyncio
-    async def test_validate_entity_schema_invalid_enum(self):
-        """Test entity schema validation with invalid enum values."""
-        properties = json.dumps(
-            {
-                "name": "test-service",
-                "status": "invalid_status",  # Invalid enum value
-                "created_at": "2024-01-01T00:00:00Z",
-                "updated_at": "2024-01-01T00:00:00Z",
-            }
+    async def test_validate_entity_schema_batch_unknown_entity(self):
+        """Test every payload of an unknown entity type is rejected."""
+        results = await schema_validation.validate_entity_schema_batch(
+            "UnknownEntity", [_UNKNOWN_ENTITY] * 3
         )
 
-        result = await validate_entity_schema("Service", properties)
-
-        assert result["valid"] is False
-        assert len(result["errors"]) > 0
-
-        # Should have error about invalid enum value
-        error_text = " ".join(result["errors"])
-        assert "status" in error_text
-        assert "active" in error_text or "inactive" in error_text
+        assert [result["valid"] for result in results] == [False] * 3
+        assert "Unknown entity type" in results[0]["errors"][0]
 
     @pytest.mark.asyncio
-    async def test_validate_entity_schema_invalid_json(self):
-        """Test entity schema validation with invalid JSON."""
-        invalid_json = "{ invalid json structure"
+    async def test_validate_entity_schema_batch_tool(self):
+        """Test the batch tool validates a JSON array of entities in order."""
+        payloads = [json.loads(_VALID_SERVICE), json.loads(_INVALID_ENUM)]
 
-        result = await validate_entity_schema("Service", invalid_json)
+        result = await validate_entity_schema_batch("Service", json.dumps(payloads))
 
         assert result["valid"] is False
-        assert len(result["errors"]) > 0
-        assert (
-            "JSON parsing error" in result["errors"][0]
-            or "Invalid JSON" in result["errors"][0]
+        assert result["invalid_count"] == 1
+        assert [item["valid"] for item in result["results"]] == [True, False]
+        assert result["results"][1] == await validate_entity_schema(
+            "Service", _INVALID_ENUM
         )
 
     @pytest.mark.asyncio
-    async def test_validate_entity_schema_unknown_entity(self):
-        """Test entity schema validation with unknown entity type."""
-        properties = json.dumps({"name": "test"})
-
-        result = await validate_entity_schema("UnknownEntity", properties)
+    @pytest.mark.parametrize(
+        "properties_list", [_INVALID_JSON, _VALID_SERVICE], ids=["json", "object"]
+    )
+    async def test_validate_entity_schema_batch_tool_rejects_non_array(
+        self, properties_list
+    ):
+        """Test the batch tool reports malformed input instead of raising."""
+        result = await validate_entity_schema_batch("Service", properties_list)
 
         assert result["valid"] is False
-        assert "Unknown entity type" in result["errors"][0]
-
-    @pytest.mark.asyncio
-    async def test_validate_entity_schema_extra_properties(self):
-        """Test entity schema validation with extra properties."""
-        properties = json.dumps(
-            {
-                "name": "test-service",
-                "status": "active",
-                "created_at": "2024-01-01T00:00:00Z",
-                "updated_at": "2024-01-01T00:00:00Z",
-                "extra_property": "not_in_schema",
-            }
-        )
-
-        result = await validate_entity_schema("Service", properties)
-
-        # Should be valid but have warnings
-        assert result["valid"] is True
-        assert len(result["warnings"]) > 0
-        assert "extra_property" in result["warnings"][0]
+        assert "properties_list" in result["errors"][0]
 
     @pytest.mark.asyncio
     async def test_validate_relationship_valid(self):
@@ -281,73 +385,100 @@ class TestMCPServerTools:
             assert "OWNS" in result["suggestions"]
 
 
+_DEFAULT_TYPES = {"boolean": bool, "integer": int, "string": str}
+_CONSTRAINT_PREFIXES = ("UNIQUE", "CHECK", "NOT NULL")
+
+
+@pytest.fixture(scope="session")
+def schema_report():
+    """
+    Walk every entity definition once and collect consistency problems.
+
+    Each TestSchemaConsistency test asserts on one list of the report, so
+    the nested entity/property dicts are traversed a single time per session.
+    """
+    report = {
+        "missing_description": [],
+        "missing_properties": [],
+        "bad_required": [],
+        "bad_defaults": [],
+        "bad_constraints": [],
+        "bad_indexes": [],
+    }
+
+    for entity_name, entity_def in knowledge_graph_schema.entity_types.items():
+        if "description" not in entity_def:
+            report["missing_description"].append(entity_name)
+        properties = entity_def.get("properties") or {}
+        if not properties:
+            report["missing_properties"].append(entity_name)
+
+        for prop_name, prop_def in properties.items():
+            # Required field should be boolean
+            if "required" in prop_def and not isinstance(prop_def["required"], bool):
+                report["bad_required"].append((entity_name, prop_name))
+
+            # Default values should match type
+            expected_type = _DEFAULT_TYPES.get(prop_def.get("type"))
+            if (
+                "default" in prop_def
+                and expected_type is not None
+                and not isinstance(prop_def["default"], expected_type)
+            ):
+                report["bad_defaults"].append((entity_name, prop_name))
+
+        # Constraints should start with a constraint type
+        for constraint in entity_def.get("constraints", ()):
+            if not (
+                isinstance(constraint, str)
+                and constraint.startswith(_CONSTRAINT_PREFIXES)
+            ):
+                report["bad_constraints"].append((entity_name, constraint))
+
+        for index_field in entity_def.get("indexes", ()):
+            if index_field not in properties:
+                report["bad_indexes"].append((entity_name, index_field))
+
+    return report
+
+
 class TestSchemaConsistency:
     """Test schema consistency and integrity."""
 
-    def test_all_entities_have_required_fields(self):
+    def test_all_entities_have_required_fields(self, schema_report):
         """Test that all entities have required schema fields."""
-        for entity_name, entity_def in knowledge_graph_schema.entity_types.items():
-            assert "description" in entity_def, f"{entity_name} missing description"
-            assert "properties" in entity_def, f"{entity_name} missing properties"
-            assert len(entity_def["properties"]) > 0, f"{entity_name} has no properties"
+        assert not schema_report["missing_description"], "Entities missing description"
+        assert not schema_report["missing_properties"], "Entities with no properties"
 
     def test_relationship_entity_references_valid(self):
         """Test that all relationships reference valid entities."""
-        entity_names = set(knowledge_graph_schema.entity_types.keys())
-
-        for rel in knowledge_graph_schema.relationships:
-            assert rel["from"] in entity_names, f"Invalid from entity: {rel['from']}"
-            assert rel["to"] in entity_names, f"Invalid to entity: {rel['to']}"
+        # One set difference over the triplet index instead of per-relationship lookups
+        referenced = {
+            entity
+            for from_type, to_type, _ in knowledge_graph_schema.relationship_index
+            for entity in (from_type, to_type)
+        }
+        invalid = referenced - knowledge_graph_schema.entity_names
+        assert not invalid, f"Invalid relationship entities: {sorted(invalid)}"
 
     def test_no_duplicate_relationships(self):
         """Test that there are no duplicate relationship definitions."""
-        seen_relationships = set()
-
-        for rel in knowledge_graph_schema.relationships:
-            rel_key = (rel["from"], rel["to"], rel["type"])
-            assert rel_key not in seen_relationships, (
-                f"Duplicate relationship: {rel_key}"
-            )
-            seen_relationships.add(rel_key)
-
-    def test_entity_property_consistency(self):
+        relationships = knowledge_graph_schema.relationships
+        # The triplet index keeps one entry per (from, to, type)
+        if len(knowledge_graph_schema.relationship_index) != len(relationships):
+            counts = Counter(map(itemgetter("from", "to", "type"), relationships))
+            duplicates = [key for key, count in counts.items() if count > 1]
+            pytest.fail(f"Duplicate relationships: {duplicates}")
+
+    def test_entity_property_consistency(self, schema_report):
         """Test entity property definition consistency."""
-        for entity_name, entity_def in knowledge_graph_schema.entity_types.items():
-            for prop_name, prop_def in entity_def["properties"].items():
-                # Required field should be boolean
-                if "required" in prop_def:
-                    assert isinstance(prop_def["required"], bool)
-
-                # Default values should match type
-                if "default" in prop_def:
-                    default_val = prop_def["default"]
-                    prop_type = prop_def["type"]
-
-                    if prop_type == "boolean":
-                        assert isinstance(default_val, bool)
-                    elif prop_type == "integer":
-                        assert isinstance(default_val, int)
-                    elif prop_type == "string":
-                        assert isinstance(default_val, str)
-
-    def test_constraint_format_consistency(self):
+        assert not schema_report["bad_required"]
+        assert not schema_report["bad_defaults"]
+
+    def test_constraint_format_consistency(self, schema_report):
         """Test that constraint formats are consistent."""
-        for entity_name, entity_def in knowledge_graph_schema.entity_types.items():
-            if "constraints" in entity_def:
-                for constraint in entity_def["constraints"]:
-                    assert isinstance(constraint, str)
-                    # Should start with constraint type
-                    assert any(
-                        constraint.startswith(ct)
-                        for ct in ["UNIQUE", "CHECK", "NOT NULL"]
-                    )
-
-    def test_index_field_validity(self):
+        assert not schema_report["bad_constraints"]
+
+    def test_index_field_validity(self, schema_report):
         """Test that indexed fields exist in entity properties."""
-        for entity_name, entity_def in knowledge_graph_schema.entity_types.items():
-            if "indexes" in entity_def:
-                properties = entity_def["properties"]
-                for index_field in entity_def["indexes"]:
-                    assert index_field in properties, (
-                        f"Index field {index_field} not found in {entity_name} properties"
-                    )
+        assert not schema_report["bad_indexes"]
@@ -3,7 +3,7 @@ Unit tests for Neo4jConnector class.
 Tests connection management, query execution, and error handling with mocking.
 """
 
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from knowledge_graph_mcp.tools.db_operations import Neo4jConnector
@@ -81,6 +81,44 @@ class TestNeo4jConnector:
         assert driver1 == driver2
         assert mock_driver_factory.call_count == 1  # Only called once
 
+    @pytest.mark.asyncio
+    @patch("knowledge_graph_mcp.tools.db_operations.AsyncGraphDatabase.driver")
+    async def test_get_driver_default_skips_env_lookup(
+        self, mock_driver_factory, mock_env_vars
+    ):
+        """Test the env-configured driver is reused without re-reading the env."""
+        Neo4jConnector._drivers.clear()
+        driver1 = await Neo4jConnector.get_driver()
+
+        with patch.object(Neo4jConnector, "_get_config_from_env") as mock_config:
+            driver2 = await Neo4jConnector.get_driver()
+
+        assert driver1 is driver2
+        mock_config.assert_not_called()
+
+        # A cleared registry is never bypassed
+        Neo4jConnector._drivers.clear()
+        await Neo4jConnector.get_driver()
+        assert mock_driver_factory.call_count == 2
+
+    @pytest.mark.asyncio
+    @patch("knowledge_graph_mcp.tools.db_operations.AsyncGraphDatabase.driver")
+    async def test_get_driver_default_follows_env_changes(
+        self, mock_driver_factory, mock_env_vars, monkeypatch
+    ):
+        """Test changing NEO4J_URI after first use resolves a new driver."""
+        mock_driver_factory.side_effect = lambda **kwargs: AsyncMock()
+        Neo4jConnector._drivers.clear()
+        driver1 = await Neo4jConnector.get_driver()
+
+        monkeypatch.setenv("NEO4J_URI", "bolt://other-host:7687")
+        driver2 = await Neo4jConnector.get_driver()
+
+        assert driver2 is not driver1
+        assert mock_driver_factory.call_args.kwargs["uri"] == "bolt://other-host:7687"
+        assert await Neo4jConnector.get_driver() is driver2
+        Neo4jConnector._drivers.clear()
+
     @pytest.mark.asyncio
     async def test_close_driver_all(self):
         """Test closing all drivers."""
@@ -133,64 +171,59 @@ class TestNeo4jConnector:
         mock_driver.session.assert_called_once_with(database="test_db")
 
     @pytest.mark.asyncio
-    @patch("knowledge_graph_mcp.tools.db_operations.Neo4jConnector.get_session")
-    async def test_execute_query_success(self, mock_get_session):
-        """Test successful query execution."""
-        mock_session = AsyncMock()
-        mock_result = AsyncMock()
-        mock_result.data.return_value = [{"test": "value"}]
-        mock_session.run.return_value = mock_result
+    @patch("knowledge_graph_mcp.tools.db_operations.Neo4jConnector.get_driver")
+    async def test_get_session_defaults_database_from_env(
+        self, mock_get_driver, monkeypatch
+    ):
+        """Test sessions target NEO4J_DATABASE when no database is given."""
+        monkeypatch.setenv("NEO4J_DATABASE", "neo4j")
+        mock_driver = MagicMock()
+        mock_driver.session.return_value.__aenter__ = AsyncMock()
+        mock_driver.session.return_value.__aexit__ = AsyncMock(return_value=None)
+        mock_get_driver.return_value = mock_driver
 
-        mock_get_session.return_value.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_get_session.return_value.__aexit__ = AsyncMock(return_value=None)
+        async with Neo4jConnector.get_session():
+            pass
+
+        mock_driver.session.assert_called_once_with(database="neo4j")
+
+    @pytest.mark.asyncio
+    async def test_execute_query_success(self, mock_session_ctx):
+        """Test successful query execution."""
+        mock_session_ctx.result_data = [{"test": "value"}]
 
         result = await Neo4jConnector.execute_query("RETURN 1")
 
         assert result == [{"test": "value"}]
-        mock_session.run.assert_called_once()
+        assert len(mock_session_ctx.calls) == 1
 
     @pytest.mark.asyncio
-    @patch("knowledge_graph_mcp.tools.db_operations.Neo4jConnector.get_session")
-    async def test_execute_query_service_unavailable(self, mock_get_session):
+    async def test_execute_query_service_unavailable(self, mock_session_ctx):
         """Test query execution with service unavailable error."""
-        mock_session = AsyncMock()
-        mock_session.run.side_effect = ServiceUnavailable("Service unavailable")
-
-        mock_get_session.return_value.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_get_session.return_value.__aexit__ = AsyncMock(return_value=None)
+        mock_session_ctx.error = ServiceUnavailable("Service unavailable")
 
         with pytest.raises(ServiceUnavailable):
             await Neo4jConnector.execute_query("RETURN 1")
 
     @pytest.mark.asyncio
-    @patch("knowledge_graph_mcp.tools.db_operations.Neo4jConnector.get_session")
-    async def test_execute_write_query(self, mock_get_session):
+    async def test_execute_write_query(self, mock_session_ctx):
         """Test write query execution with transaction."""
-        mock_session = AsyncMock()
-        mock_session.execute_write.return_value = [{"created": "node"}]
-
-        mock_get_session.return_value.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_get_session.return_value.__aexit__ = AsyncMock(return_value=None)
+        mock_session_ctx.result_data = [{"created": "node"}]
 
         result = await Neo4jConnector.execute_write_query("CREATE (n) RETURN n")
 
         assert result == [{"created": "node"}]
-        mock_session.execute_write.assert_called_once()
+        assert mock_session_ctx.calls == [("CREATE (n) RETURN n", {})]
 
     @pytest.mark.asyncio
-    @patch("knowledge_graph_mcp.tools.db_operations.Neo4jConnector.get_session")
-    async def test_execute_read_query(self, mock_get_session):
+    async def test_execute_read_query(self, mock_session_ctx):
         """Test read query execution with transaction."""
-        mock_session = AsyncMock()
-        mock_session.execute_read.return_value = [{"found": "data"}]
-
-        mock_get_session.return_value.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_get_session.return_value.__aexit__ = AsyncMock(return_value=None)
+        mock_session_ctx.result_data = [{"found": "data"}]
 
         result = await Neo4jConnector.execute_read_query("MATCH (n) RETURN n")
 
         assert result == [{"found": "data"}]
-        mock_session.execute_read.assert_called_once()
+        assert mock_session_ctx.calls == [("MATCH (n) RETURN n", {})]
 
     @pytest.mark.asyncio
     @patch("knowledge_graph_mcp.tools.db_operations.Neo4jConnector.get_driver")
@@ -220,34 +253,52 @@ class TestNeo4jConnector:
         assert result is False
 
     @pytest.mark.asyncio
-    @patch("knowledge_graph_mcp.tools.db_operations.Neo4jConnector.get_session")
-    async def test_execute_query_with_parameters(self, mock_get_session):
-        """Test query execution with parameters."""
-        mock_session = AsyncMock()
-        mock_result = AsyncMock()
-        mock_result.data.return_value = [{"param_value": "test"}]
-        mock_session.run.return_value = mock_result
+    @patch("knowledge_graph_mcp.tools.db_operations.Neo4jConnector.get_driver")
+    async def test_warm_up_runs_once_per_driver(self, mock_get_driver, mock_env_vars):
+        """Test warm-up only contacts the database on its first call."""
+        mock_driver = AsyncMock()
+        mock_get_driver.return_value = mock_driver
+        Neo4jConnector._warmed.clear()
 
-        mock_get_session.return_value.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_get_session.return_value.__aexit__ = AsyncMock(return_value=None)
+        await Neo4jConnector.warm_up()
+        with patch.object(Neo4jConnector, "_get_config_from_env") as mock_config:
+            await Neo4jConnector.warm_up()
+
+        mock_driver.verify_connectivity.assert_called_once()
+        mock_config.assert_not_called()
+        Neo4jConnector._warmed.clear()
+
+    @pytest.mark.asyncio
+    @patch("knowledge_graph_mcp.tools.db_operations.Neo4jConnector.get_driver")
+    async def test_warm_up_failure_is_not_raised(self, mock_get_driver, mock_env_vars):
+        """Test warm-up failures are left for the real query to surface."""
+        mock_driver = AsyncMock()
+        mock_driver.verify_connectivity.side_effect = ServiceUnavailable(
+            "Connection failed"
+        )
+        mock_get_driver.return_value = mock_driver
+        Neo4jConnector._warmed.clear()
+
+        await Neo4jConnector.warm_up()
+
+        assert not Neo4jConnector._warmed
+
+    @pytest.mark.asyncio
+    async def test_execute_query_with_parameters(self, mock_session_ctx):
+        """Test query execution with parameters."""
+        mock_session_ctx.result_data = [{"param_value": "test"}]
 
         parameters = {"param": "test_value"}
         result = await Neo4jConnector.execute_query("RETURN $param", parameters)
 
         assert result == [{"param_value": "test"}]
         # Verify parameters were passed correctly
-        call_args = mock_session.run.call_args
-        assert call_args[0][1] == parameters  # Second argument should be parameters
+        assert mock_session_ctx.calls[-1][1] == parameters
 
     @pytest.mark.asyncio
-    @patch("knowledge_graph_mcp.tools.db_operations.Neo4jConnector.get_session")
-    async def test_execute_query_transient_error(self, mock_get_session):
+    async def test_execute_query_transient_error(self, mock_session_ctx):
         """Test query execution with transient error."""
-        mock_session = AsyncMock()
-        mock_session.run.side_effect = TransientError("Transient error")
-
-        mock_get_session.return_value.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_get_session.return_value.__aexit__ = AsyncMock(return_value=None)
+        mock_session_ctx.error = TransientError("Transient error")
 
         with pytest.raises(TransientError):
             await Neo4jConnector.execute_query("RETURN 1")
@@ -258,12 +309,10 @@ class TestNeo4jConnector:
         encrypted_uris = ["neo4j+s://localhost:7687", "bolt+s://localhost:7687"]
 
         for uri in encrypted_uris:
-            encrypted = uri.startswith("neo4j+s://") or uri.startswith("bolt+s://")
-            assert encrypted is True
+            assert Neo4jConnector._is_encrypted(uri) is True
 
         # Test non-encrypted URIs
         non_encrypted_uris = ["bolt://localhost:7687", "neo4j://localhost:7687"]
 
         for uri in non_encrypted_uris:
-            encrypted = uri.startswith("neo4j+s://") or uri.startswith("bolt+s://")
-            assert encrypted is False
+            assert Neo4jConnector._is_encrypted(uri) is False
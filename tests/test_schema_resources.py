@@ -5,11 +5,47 @@ Tests the knowledge graph schema functionality.
 
 import json
 
+import pytest
 from knowledge_graph_mcp.resources.schemas import (
+    PROPERTY_TYPES,
     KnowledgeGraphSchema,
     knowledge_graph_schema,
 )
 
+_VALID_PROP_TYPES = frozenset(PROPERTY_TYPES)
+
+
+_VALID_RELATIONSHIPS = [
+    ("Service", "Module", "CONTAINS"),
+    ("Class", "Interface", "IMPLEMENTS"),
+    ("Function", "BusinessRule", "IMPLEMENTS"),
+    ("Service", "Database", "OWNS"),
+]
+
+_INVALID_RELATIONSHIPS = [
+    ("Service", "Module", "INVALID_RELATIONSHIP"),
+    ("NonExistentEntity", "Service", "CONTAINS"),
+    ("Service", "NonExistentEntity", "CONTAINS"),
+]
+
+# One case per entity type and per property, so a bad definition fails on its own
+_ENTITY_NAMES = list(knowledge_graph_schema.entity_types)
+_ENTITY_PROPERTIES = [
+    (entity_name, prop_name)
+    for entity_name, entity_def in knowledge_graph_schema.entity_types.items()
+    for prop_name in entity_def.get("properties", {})
+]
+
+
+def _triplet_ids(cases):
+    return [f"{src}-{rel_type}->{dst}" for src, dst, rel_type in cases]
+
+
+@pytest.fixture(scope="module")
+def schema():
+    """The default schema instance, parsed from YAML once at import."""
+    return knowledge_graph_schema
+
 
 class TestKnowledgeGraphSchema:
     """Test cases for KnowledgeGraphSchema class."""
@@ -20,59 +56,65 @@ class TestKnowledgeGraphSchema:
 
         assert len(schema.entity_types) > 0
         assert len(schema.relationships) > 0
-        assert "schema_summary" in schema.__dict__
+        assert len(schema.schema_summary) > 0
+
+    def test_schema_slots(self):
+        """Test the schema has no instance __dict__ and switching refills slots."""
+        schema = KnowledgeGraphSchema()
+
+        assert not hasattr(schema, "__dict__")
+        with pytest.raises(AttributeError):
+            schema.undeclared_attribute = True
+
+        # Every slot must hold the new schema's value after a switch, including
+        # the JSON cache filled before it
+        schema.to_json()
+        schema.switch_schema("medical_domain")
+        expected = KnowledgeGraphSchema("medical_domain")
+        for slot in KnowledgeGraphSchema.__slots__:
+            assert getattr(schema, slot) == getattr(expected, slot), slot
 
-    def test_entity_types_structure(self):
+    @pytest.mark.parametrize("entity_name", _ENTITY_NAMES)
+    def test_entity_types_structure(self, schema, entity_name):
         """Test entity types structure and required fields."""
-        for entity_name, entity_def in knowledge_graph_schema.entity_types.items():
-            assert "description" in entity_def
-            assert "properties" in entity_def
-
-            # Check properties structure
-            for prop_name, prop_def in entity_def["properties"].items():
-                assert "type" in prop_def
-                assert prop_def["type"] in [
-                    "string",
-                    "integer",
-                    "float",
-                    "boolean",
-                    "datetime",
-                    "array",
-                    "object",
-                    "enum",
-                ]
-
-    def test_relationships_structure(self):
+        entity_def = schema.entity_types[entity_name]
+        assert "description" in entity_def
+        assert "properties" in entity_def
+
+        # Check properties structure
+        for prop_name, prop_def in entity_def["properties"].items():
+            assert "type" in prop_def
+            assert prop_def["type"] in _VALID_PROP_TYPES
+
+    def test_relationships_structure(self, schema):
         """Test relationships structure and required fields."""
-        for relationship in knowledge_graph_schema.relationships:
+        for relationship in schema.relationships:
             assert "from" in relationship
             assert "to" in relationship
             assert "type" in relationship
             assert "description" in relationship
 
             # Verify entity types exist
-            assert relationship["from"] in knowledge_graph_schema.entity_types
-            assert relationship["to"] in knowledge_graph_schema.entity_types
+            assert relationship["from"] in schema.entity_types
+            assert relationship["to"] in schema.entity_types
 
-    def test_get_entity_schema(self):
+    def test_get_entity_schema(self, schema):
         """Test getting schema for specific entity type."""
-        service_schema = knowledge_graph_schema.get_entity_schema("Service")
+        service_schema = schema.get_entity_schema("Service")
 
         assert service_schema is not None
         assert "description" in service_schema
         assert "properties" in service_schema
         assert "name" in service_schema["properties"]
 
-    def test_get_entity_schema_nonexistent(self):
+    def test_get_entity_schema_nonexistent(self, schema):
         """Test getting schema for non-existent entity type."""
-        schema = knowledge_graph_schema.get_entity_schema("NonExistentEntity")
-        assert schema == {}
+        entity_schema = schema.get_entity_schema("NonExistentEntity")
+        assert entity_schema == {}
 
-    def test_get_relationships_for_entity(self):
+    def test_get_relationships_for_entity(self, schema):
         """Test getting relationships for specific entity."""
-        service_relationships = knowledge_graph_schema.get_relationships_for_entity(
-            "Service"
-        )
+        service_relationships = schema.get_relationships_for_entity("Service")
 
         assert len(service_relationships) > 0
 
@@ -80,9 +122,24 @@ class TestKnowledgeGraphSchema:
         for rel in service_relationships:
             assert rel["from"] == "Service" or rel["to"] == "Service"
 
-    def test_get_relationship_types(self):
+        # The precomputed index matches a scan
+        assert service_relationships == [
+            rel
+            for rel in schema.relationships
+            if rel["from"] == "Service" or rel["to"] == "Service"
+        ]
+
+        # Mutating a returned list leaves the index intact
+        service_relationships.clear()
+        assert schema.get_relationships_for_entity("Service") == (
+            schema.by_entity["Service"]
+        )
+        assert len(schema.get_relationships_for_entity("Service")) > 0
+        assert schema.get_relationships_for_entity("NonExistentEntity") == []
+
+    def test_get_relationship_types(self, schema):
         """Test getting all unique relationship types."""
-        rel_types = knowledge_graph_schema.get_relationship_types()
+        rel_types = schema.get_relationship_types()
 
         assert len(rel_types) > 0
         assert isinstance(rel_types, list)
@@ -92,44 +149,51 @@ class TestKnowledgeGraphSchema:
         for expected_type in expected_types:
             assert expected_type in rel_types
 
-    def test_validate_relationship_valid(self):
-        """Test validating valid relationships."""
-        # Test known valid relationships
-        valid_cases = [
-            ("Service", "Module", "CONTAINS"),
-            ("Class", "Interface", "IMPLEMENTS"),
-            ("Function", "BusinessRule", "IMPLEMENTS"),
-            ("Service", "Database", "OWNS"),
+    def test_get_relationship_types_skips_untyped_entries(self):
+        """Test relationships without a type do not add None or "" to the types."""
+        schema = KnowledgeGraphSchema.__new__(KnowledgeGraphSchema)
+        schema.relationships = [
+            {"from": "Service", "to": "Module", "type": "CONTAINS"},
+            {"from": "Service", "to": "Module"},
+            {"from": "Service", "to": "Module", "type": ""},
         ]
-
-        for from_entity, to_entity, rel_type in valid_cases:
-            is_valid = knowledge_graph_schema.validate_relationship(
-                from_entity, to_entity, rel_type
-            )
-            assert is_valid is True, (
-                f"{from_entity} -{rel_type}-> {to_entity} should be valid"
-            )
-
-    def test_validate_relationship_invalid(self):
+        schema._build_relationship_indexes()
+
+        assert schema.get_relationship_types() == ["CONTAINS"]
+        assert schema.by_from_to == {("Service", "Module"): ["CONTAINS"]}
+        assert list(schema.relationship_index) == [("Service", "Module", "CONTAINS")]
+
+    @pytest.mark.parametrize(
+        "from_entity,to_entity,rel_type",
+        _VALID_RELATIONSHIPS,
+        ids=_triplet_ids(_VALID_RELATIONSHIPS),
+    )
+    def test_validate_relationship_valid(
+        self, schema, from_entity, to_entity, rel_type
+    ):
+        """Test validating valid relationships."""
+        is_valid = schema.validate_relationship(from_entity, to_entity, rel_type)
+        assert (
+            is_valid is True
+        ), f"{from_entity} -{rel_type}-> {to_entity} should be valid"
+
+    @pytest.mark.parametrize(
+        "from_entity,to_entity,rel_type",
+        _INVALID_RELATIONSHIPS,
+        ids=_triplet_ids(_INVALID_RELATIONSHIPS),
+    )
+    def test_validate_relationship_invalid(
+        self, schema, from_entity, to_entity, rel_type
+    ):
         """Test validating invalid relationships."""
-        # Test known invalid relationships
-        invalid_cases = [
-            ("Service", "Module", "INVALID_RELATIONSHIP"),
-            ("NonExistentEntity", "Service", "CONTAINS"),
-            ("Service", "NonExistentEntity", "CONTAINS"),
-        ]
-
-        for from_entity, to_entity, rel_type in invalid_cases:
-            is_valid = knowledge_graph_schema.validate_relationship(
-                from_entity, to_entity, rel_type
-            )
-            assert is_valid is False, (
-                f"{from_entity} -{rel_type}-> {to_entity} should be invalid"
-            )
+        is_valid = schema.validate_relationship(from_entity, to_entity, rel_type)
+        assert (
+            is_valid is False
+        ), f"{from_entity} -{rel_type}-> {to_entity} should be invalid"
 
-    def test_schema_summary_structure(self):
+    def test_schema_summary_structure(self, schema):
         """Test schema summary structure and content."""
-        summary = knowledge_graph_schema.schema_summary
+        summary = schema.schema_summary
 
         assert "version" in summary
         assert "description" in summary
@@ -144,14 +208,12 @@ class TestKnowledgeGraphSchema:
         assert "unique_relationship_types" in stats
 
         # Verify statistics are correct
-        assert stats["total_entity_types"] == len(knowledge_graph_schema.entity_types)
-        assert stats["total_relationship_types"] == len(
-            knowledge_graph_schema.relationships
-        )
+        assert stats["total_entity_types"] == len(schema.entity_types)
+        assert stats["total_relationship_types"] == len(schema.relationships)
 
-    def test_entity_categories(self):
+    def test_entity_categories(self, schema):
         """Test entity categorization."""
-        categories = knowledge_graph_schema.schema_summary["entity_categories"]
+        categories = schema.schema_summary["entity_categories"]
 
         expected_categories = [
             "Service Layer",
@@ -168,39 +230,33 @@ class TestKnowledgeGraphSchema:
             assert category in categories
             assert len(categories[category]) > 0
 
-    def test_to_dict_conversion(self):
+    def test_to_dict_conversion(self, schema):
         """Test schema conversion to dictionary."""
-        schema_dict = knowledge_graph_schema.to_dict()
+        schema_dict = schema.to_dict()
 
         assert "entity_types" in schema_dict
         assert "relationships" in schema_dict
         assert "schema_summary" in schema_dict
 
         # Verify structure matches original
-        assert len(schema_dict["entity_types"]) == len(
-            knowledge_graph_schema.entity_types
-        )
-        assert len(schema_dict["relationships"]) == len(
-            knowledge_graph_schema.relationships
-        )
+        assert len(schema_dict["entity_types"]) == len(schema.entity_types)
+        assert len(schema_dict["relationships"]) == len(schema.relationships)
 
-    def test_to_json_serialization(self):
+    def test_to_json_serialization(self, schema):
         """Test schema JSON serialization."""
-        schema_json = knowledge_graph_schema.to_json()
+        schema_json = schema.to_json()
+        assert isinstance(schema_json, str)
 
-        # Should be valid JSON
-        parsed = json.loads(schema_json)
+        # Should be valid JSON carrying exactly the to_dict() structure, whose
+        # keys test_to_dict_conversion already checks
+        assert json.loads(schema_json) == schema.to_dict()
 
-        assert "entity_types" in parsed
-        assert "relationships" in parsed
-        assert "schema_summary" in parsed
-
-    def test_entity_constraints_and_indexes(self):
+    def test_entity_constraints_and_indexes(self, schema):
         """Test entity constraints and indexes configuration."""
         entities_with_constraints = 0
         entities_with_indexes = 0
 
-        for entity_name, entity_def in knowledge_graph_schema.entity_types.items():
+        for entity_name, entity_def in schema.entity_types.items():
             if "constraints" in entity_def:
                 entities_with_constraints += 1
                 assert isinstance(entity_def["constraints"], list)
@@ -212,45 +268,31 @@ class TestKnowledgeGraphSchema:
                 assert len(entity_def["indexes"]) > 0
 
         # Most entities should have constraints and indexes
-        assert (
-            entities_with_constraints > len(knowledge_graph_schema.entity_types) * 0.7
-        )
-        assert entities_with_indexes > len(knowledge_graph_schema.entity_types) * 0.8
-
-    def test_property_type_validation(self):
+        assert entities_with_constraints > len(schema.entity_types) * 0.7
+        assert entities_with_indexes > len(schema.entity_types) * 0.8
+
+    @pytest.mark.parametrize(
+        "entity_name,prop_name",
+        _ENTITY_PROPERTIES,
+        ids=[f"{entity}.{prop}" for entity, prop in _ENTITY_PROPERTIES],
+    )
+    def test_property_type_validation(self, schema, entity_name, prop_name):
         """Test property type definitions."""
-        valid_types = [
-            "string",
-            "integer",
-            "float",
-            "boolean",
-            "datetime",
-            "array",
-            "object",
-            "enum",
-        ]
-
-        for entity_name, entity_def in knowledge_graph_schema.entity_types.items():
-            for prop_name, prop_def in entity_def["properties"].items():
-                assert prop_def["type"] in valid_types, (
-                    f"Invalid type in {entity_name}.{prop_name}: {prop_def['type']}"
-                )
+        prop_def = schema.entity_types[entity_name]["properties"][prop_name]
+        assert (
+            prop_def["type"] in _VALID_PROP_TYPES
+        ), f"Invalid type in {entity_name}.{prop_name}: {prop_def['type']}"
 
-                # If enum type, should have enum values
-                if prop_def["type"] == "enum":
-                    assert "enum" in prop_def
-                    assert isinstance(prop_def["enum"], list)
-                    assert len(prop_def["enum"]) > 0
+        # If enum type, should have enum values
+        if prop_def["type"] == "enum":
+            assert "enum" in prop_def
+            assert isinstance(prop_def["enum"], list)
+            assert len(prop_def["enum"]) > 0
 
-    def test_relationship_bidirectionality(self):
+    def test_relationship_bidirectionality(self, schema):
         """Test that relationships make sense bidirectionally."""
-        relationship_pairs = {}
-
-        for rel in knowledge_graph_schema.relationships:
-            key = (rel["from"], rel["to"])
-            if key not in relationship_pairs:
-                relationship_pairs[key] = []
-            relationship_pairs[key].append(rel["type"])
+        # The schema already indexes relationship types by (from, to) pair
+        relationship_pairs = schema.by_from_to
 
         # Check for some expected bidirectional relationships
         service_module = relationship_pairs.get(("Service", "Module"), [])
@@ -259,16 +301,56 @@ class TestKnowledgeGraphSchema:
         class_interface = relationship_pairs.get(("Class", "Interface"), [])
         assert "IMPLEMENTS" in class_interface
 
-    def test_schema_version_consistency(self):
+    def test_relationship_indexes(self, schema):
+        """Test precomputed relationship indexes match the relationship list."""
+        for rel in schema.relationships:
+            assert rel in schema.by_entity[rel["from"]]
+            assert rel in schema.by_entity[rel["to"]]
+            assert rel["type"] in schema.by_from_to[(rel["from"], rel["to"])]
+            assert rel["to"] in schema.by_from_type[(rel["from"], rel["type"])]
+            assert (
+                schema.relationship_index[(rel["from"], rel["to"], rel["type"])] is rel
+            )
+            assert rel["from"] in schema.entity_names
+
+        assert sum(len(types) for types in schema.by_from_to.values()) == len(
+            schema.relationships
+        )
+        assert "CONTAINS" in schema.by_from_to[("Service", "Module")]
+
+    def test_required_properties_index(self, schema):
+        """Test precomputed required properties match the entity definitions."""
+        for entity_type, entity_def in schema.entity_types.items():
+            expected = [
+                prop_name
+                for prop_name, prop_def in entity_def.get("properties", {}).items()
+                if prop_def.get("required", False)
+            ]
+            assert list(schema.required_properties[entity_type]) == expected
+
+    def test_section_json_cached_per_load(self):
+        """Test serialized sections are reused until the schema is reloaded."""
+        schema = KnowledgeGraphSchema()
+
+        entities_json = schema.section_json("entity_types")
+        assert json.loads(entities_json) == schema.entity_types
+        assert schema.section_json("entity_types") is entities_json
+        assert schema.to_json() is schema.to_json()
+
+        schema.switch_schema("medical_domain")
+        assert json.loads(schema.section_json("entity_types")) == schema.entity_types
+        assert json.loads(schema.to_json())["entity_types"] == schema.entity_types
+
+    def test_schema_version_consistency(self, schema):
         """Test schema version consistency."""
-        summary = knowledge_graph_schema.schema_summary
+        summary = schema.schema_summary
 
         assert "version" in summary
         assert summary["version"] == "1.0.0"
 
-    def test_usage_guidelines_presence(self):
+    def test_usage_guidelines_presence(self, schema):
         """Test that usage guidelines are present and complete."""
-        guidelines = knowledge_graph_schema.schema_summary["usage_guidelines"]
+        guidelines = schema.schema_summary["usage_guidelines"]
 
         expected_guidelines = [
             "entity_creation",
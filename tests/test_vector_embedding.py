@@ -0,0 +1,383 @@
+"""
+Unit tests for the embedding utilities.
+Tests vector quantization and embedding client behaviour without calling OpenAI.
+"""
+
+import asyncio
+import base64
+import hashlib
+import math
+from array import array
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+from knowledge_graph_mcp.server import lifespan, mcp
+from knowledge_graph_mcp.utils import vector_embedding
+from knowledge_graph_mcp.utils.quantization import dequantize_int8, quantize_int8
+from knowledge_graph_mcp.utils.rate_limiter import RateLimiter
+from knowledge_graph_mcp.utils.vector_embedding import (
+    CachedVectorEmbedding,
+    VectorEmbedding,
+    get_vector_embedding,
+)
+from openai import RateLimitError
+
+
+def _normalize(vector):
+    norm = math.sqrt(sum(v * v for v in vector))
+    return [v / norm for v in vector]
+
+
+class TestQuantization:
+    """Test cases for int8 vector quantization."""
+
+    def test_quantize_round_trip(self):
+        """Test dequantized vectors stay close to the originals."""
+        vector = _normalize([math.sin(i) for i in range(384)])
+
+        quantized, scale = quantize_int8(vector)
+        restored = dequantize_int8(quantized, scale)
+
+        assert len(quantized) == len(vector)
+        assert quantized.itemsize == 1
+        assert max(abs(a - b) for a, b in zip(vector, restored)) <= scale / 127
+
+    def test_quantize_zero_vector(self):
+        """Test the zero vector quantizes without dividing by zero."""
+        quantized, scale = quantize_int8([0.0, 0.0, 0.0])
+
+        assert list(quantized) == [0, 0, 0]
+        assert list(dequantize_int8(quantized, scale)) == [0.0, 0.0, 0.0]
+
+
+@pytest.fixture(autouse=True)
+def fresh_client():
+    """Give each test its own shared OpenAI client so mocks do not leak."""
+    vector_embedding._get_client.cache_clear()
+    yield
+    vector_embedding._get_client.cache_clear()
+
+
+def _fake_response(texts):
+    """Build a base64 embeddings API response with one vector per text."""
+    if isinstance(texts, str):
+        texts = [texts]
+    return SimpleNamespace(
+        data=[
+            SimpleNamespace(
+                embedding=base64.b64encode(
+                    array("f", [float(len(text)), 0.5, -0.25]).tobytes()
+                ).decode("ascii")
+            )
+            for text in texts
+        ]
+    )
+
+
+@pytest.fixture
+def cached_embedding(tmp_path, monkeypatch):
+    """CachedVectorEmbedding on a temporary database with a mocked API call."""
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    embedding = CachedVectorEmbedding(str(tmp_path / "embeddings.db"), dimension=3)
+    embedding.client.embeddings.create = AsyncMock(
+        side_effect=lambda input, **kwargs: _fake_response(input)
+    )
+    yield embedding
+    embedding.close()
+
+
+class TestCachedVectorEmbedding:
+    """Test cases for the persistent embedding cache."""
+
+    @pytest.mark.asyncio
+    async def test_batch_embed_only_requests_misses(self, cached_embedding):
+        """Test cached texts are not sent to the API again."""
+        await cached_embedding.batch_embed(["alpha", "be"])
+        result = await cached_embedding.batch_embed(["be", "gamma", "alpha"])
+
+        assert result == [[2.0, 0.5, -0.25], [5.0, 0.5, -0.25], [5.0, 0.5, -0.25]]
+        assert cached_embedding.client.embeddings.create.call_count == 2
+        last_call = cached_embedding.client.embeddings.create.call_args
+        assert last_call.kwargs["input"] == ["gamma"]
+
+    @pytest.mark.asyncio
+    async def test_cache_persists_across_instances(self, cached_embedding, tmp_path):
+        """Test vectors written by one instance are served to the next."""
+        await cached_embedding.embed("persisted")
+
+        reopened = CachedVectorEmbedding(str(tmp_path / "embeddings.db"), dimension=3)
+        reopened.client.embeddings.create = AsyncMock()
+        try:
+            assert await reopened.embed("persisted") == [9.0, 0.5, -0.25]
+            reopened.client.embeddings.create.assert_not_called()
+        finally:
+            reopened.close()
+
+    @pytest.mark.asyncio
+    async def test_int8_precision_stores_quantized_vectors(self, tmp_path, monkeypatch):
+        """Test int8 precision shrinks stored vectors and dequantizes on read."""
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        path = str(tmp_path / "int8.db")
+        embedding = CachedVectorEmbedding(path, dimension=3, precision="int8")
+        embedding.client.embeddings.create = AsyncMock(
+            side_effect=lambda input, **kwargs: _fake_response(input)
+        )
+        try:
+            await embedding.embed("quantized")
+            (blob,) = embedding._db.execute("SELECT vec FROM embeddings").fetchone()
+
+            reopened = CachedVectorEmbedding(path, dimension=3)
+            vector = await reopened.batch_embed(["quantized"])
+            reopened.close()
+        finally:
+            embedding.close()
+
+        assert len(blob) == 4 + 3
+        assert vector[0] == pytest.approx([9.0, 0.5, -0.25], abs=9.0 / 127)
+
+    def test_cache_key_depends_on_dimension(self, cached_embedding):
+        """Test the same text at another dimension gets a different key."""
+        keys, token_counts = cached_embedding._prepare(["text"])
+        cached_embedding.dimension = 384
+
+        expected_key = hashlib.blake2b(
+            b"text-embedding-3-small|3|text", digest_size=16
+        ).digest()
+        assert cached_embedding._prepare(["text"])[0] != keys
+        assert keys[0] == expected_key
+        assert token_counts == [
+            vector_embedding._count_tokens("text", cached_embedding.model)
+        ]
+
+
+class TestVectorEmbedding:
+    """Test cases for the in-process embedding client behaviour."""
+
+    @pytest.fixture
+    def embedding(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        embedding = VectorEmbedding(dimension=3, cache_size=2)
+        embedding.client.embeddings.create = AsyncMock(
+            side_effect=lambda input, **kwargs: _fake_response(input)
+        )
+        return embedding
+
+    @pytest.mark.asyncio
+    async def test_embed_lru_hits_and_eviction(self, embedding):
+        """Test repeated texts are served from the LRU until evicted."""
+        await embedding.embed("one")
+        await embedding.embed("one")
+        await embedding.embed("two")
+        await embedding.embed("three")  # evicts "one"
+        await embedding.embed("one")
+
+        assert embedding.stats() == {"hits": 1, "misses": 4, "size": 2, "maxsize": 2}
+        assert embedding.client.embeddings.create.call_count == 4
+
+    @pytest.mark.asyncio
+    async def test_embed_returns_float32_arrays_on_request(self, embedding):
+        """Test as_list=False returns packed float32 copies of the vector."""
+        vector = await embedding.embed("four", as_list=False)
+        vector[0] = 0.0
+
+        assert vector.typecode == "f"
+        assert await embedding.embed("four") == [4.0, 0.5, -0.25]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_embeds_share_one_request(self, embedding):
+        """Test concurrent embed() calls are coalesced into one API request."""
+        texts = ["a", "bb", "ccc", "dddd"]
+
+        vectors = await asyncio.gather(*(embedding.embed(text) for text in texts))
+
+        assert [vector[0] for vector in vectors] == [1.0, 2.0, 3.0, 4.0]
+        embedding.client.embeddings.create.assert_called_once()
+        call = embedding.client.embeddings.create.call_args
+        assert call.kwargs["input"] == texts
+        assert call.kwargs["encoding_format"] == "base64"
+
+    @pytest.mark.asyncio
+    async def test_batch_failure_reaches_every_caller(self, embedding):
+        """Test an API error is raised to every caller in the batch."""
+        embedding.client.embeddings.create.side_effect = RuntimeError("api down")
+
+        results = await asyncio.gather(
+            embedding.embed("x"), embedding.embed("y"), return_exceptions=True
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_request_is_retried(self, embedding):
+        """Test a 429 is retried after the server's retry-after delay."""
+        response = httpx.Response(
+            429,
+            headers={"retry-after": "0"},
+            request=httpx.Request("POST", "https://api.openai.com/v1/embeddings"),
+        )
+        embedding.client.embeddings.create.side_effect = [
+            RateLimitError("rate limited", response=response, body=None),
+            _fake_response(["retry"]),
+        ]
+
+        assert await embedding.embed("retry") == [5.0, 0.5, -0.25]
+        assert embedding.client.embeddings.create.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_warm_up_embeds_in_background(self, monkeypatch):
+        """Test warm_up=True sends one tiny request and leaves the cache empty."""
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        embedding = VectorEmbedding(dimension=3, warm_up=True)
+        embedding.client.embeddings.create = AsyncMock(
+            side_effect=lambda input, **kwargs: _fake_response(input)
+        )
+
+        await embedding._warmup_task
+
+        embedding.client.embeddings.create.assert_called_once()
+        assert embedding.stats() == {
+            "hits": 0,
+            "misses": 0,
+            "size": 0,
+            "maxsize": 4096,
+        }
+
+    def test_warm_up_without_running_loop_is_skipped(self, embedding):
+        """Test construction outside an event loop does not start a warm-up."""
+        assert VectorEmbedding(dimension=3, warm_up=True)._warmup_task is None
+
+    def test_instances_share_one_client(self, embedding):
+        """Test every instance reuses the process-wide OpenAI client."""
+        other = VectorEmbedding(dimension=3)
+
+        assert other.client is embedding.client
+
+    @pytest.mark.asyncio
+    async def test_aclose_client_resets_shared_client(self, embedding):
+        """Test closing the shared client makes the next instance build a new one."""
+        await vector_embedding.aclose_client()
+
+        assert VectorEmbedding(dimension=3).client is not embedding.client
+
+    @pytest.mark.asyncio
+    async def test_lifespan_reentry_embeds_with_open_client(self, monkeypatch):
+        """Test entering the server lifespan again gives a working embedder."""
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        monkeypatch.delenv("EMBEDDING_CACHE_PATH", raising=False)
+        monkeypatch.setattr(VectorEmbedding, "_warmup", AsyncMock())
+        get_vector_embedding.cache_clear()
+
+        async with lifespan(mcp):
+            first = get_vector_embedding()
+        async with lifespan(mcp):
+            second = get_vector_embedding()
+            second.client.embeddings.create = AsyncMock(
+                side_effect=lambda input, **kwargs: _fake_response(input)
+            )
+            vector = await second.embed("hello")
+
+        assert first.client.is_closed()
+        assert second is not first
+        assert second.client is not first.client
+        assert vector[0] == 5.0
+        assert get_vector_embedding.cache_info().currsize == 0
+
+    def test_get_vector_embedding_rejects_unknown_precision(
+        self, monkeypatch, tmp_path
+    ):
+        """Test a mistyped EMBEDDING_CACHE_PRECISION fails instead of caching."""
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        monkeypatch.setenv("EMBEDDING_CACHE_PATH", str(tmp_path / "cache.db"))
+        monkeypatch.setenv("EMBEDDING_CACHE_PRECISION", "fp16")
+        get_vector_embedding.cache_clear()
+
+        with pytest.raises(ValueError, match="EMBEDDING_CACHE_PRECISION"):
+            get_vector_embedding()
+        assert not (tmp_path / "cache.db").exists()
+
+    @pytest.mark.asyncio
+    async def test_batch_embed_splits_oversized_payloads(self, embedding, monkeypatch):
+        """Test large batches are sent as ordered sub-batches under the caps."""
+        monkeypatch.setattr(vector_embedding, "_MAX_BATCH_INPUTS", 2)
+        texts = ["a", "bb", "ccc", "dddd", "eeeee"]
+
+        vectors = await embedding.batch_embed(texts)
+
+        assert [vector[0] for vector in vectors] == [1.0, 2.0, 3.0, 4.0, 5.0]
+        assert embedding.client.embeddings.create.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_batch_embed_sends_duplicates_once(self, embedding):
+        """Test repeated texts are embedded once and scattered back in order."""
+        vectors = await embedding.batch_embed(
+            ["foo", "ba", "foo", "foo"], as_list=False
+        )
+
+        assert [vector[0] for vector in vectors] == [3.0, 2.0, 3.0, 3.0]
+        assert vectors[0] is not vectors[2]
+        call = embedding.client.embeddings.create.call_args
+        assert call.kwargs["input"] == ["foo", "ba"]
+
+    def test_pack_batches_respects_token_budget(self, monkeypatch):
+        """Test sub-batches close before exceeding the token budget."""
+        monkeypatch.setattr(vector_embedding, "_MAX_BATCH_TOKENS", 10)
+
+        assert vector_embedding._pack_batches([4, 4, 4, 12, 1]) == [
+            (0, 2),
+            (2, 3),
+            (3, 4),
+            (4, 5),
+        ]
+        assert vector_embedding._pack_batches([]) == []
+
+
+class TestRateLimiter:
+    """Test cases for the embedding rate limiter."""
+
+    def test_from_env(self, monkeypatch):
+        """Test limits are read from the environment."""
+        monkeypatch.setenv("EMBEDDING_RPM_LIMIT", "60")
+        monkeypatch.setenv("EMBEDDING_TPM_LIMIT", "1200")
+        monkeypatch.setenv("EMBEDDING_MAX_CONCURRENCY", "2")
+
+        limiter = RateLimiter.from_env()
+
+        assert limiter._requests.min_interval == 1.0
+        assert limiter._tokens.capacity == 1200
+        assert limiter._semaphore._value == 2
+
+    @pytest.mark.asyncio
+    async def test_slot_paces_requests(self):
+        """Test consecutive requests are spaced by the minimum interval."""
+        limiter = RateLimiter(requests_per_minute=600, tokens_per_minute=10_000)
+        loop = asyncio.get_running_loop()
+
+        start = loop.time()
+        for _ in range(3):
+            async with limiter.slot(10):
+                pass
+
+        # 600 RPM allows one request every 0.1 seconds
+        assert loop.time() - start >= 0.19
+
+    @pytest.mark.asyncio
+    async def test_slot_caps_concurrency(self):
+        """Test no more than max_concurrency slots are held at once."""
+        # Pacing fast enough that concurrency is the binding limit
+        limiter = RateLimiter(requests_per_minute=600_000, max_concurrency=2)
+        in_flight = 0
+        peak = 0
+
+        async def request():
+            nonlocal in_flight, peak
+            async with limiter.slot(1):
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+
+        await asyncio.gather(*(request() for _ in range(6)))
+
+        assert peak == 2